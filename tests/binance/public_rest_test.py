@@ -1,6 +1,9 @@
+import asyncio
 import logging
 from datetime import datetime
 
+import httpx
+import numpy as np
 import pytest
 import pytz
 
@@ -147,3 +150,138 @@ class TestHistoricalKlinesIntegration:
 
         assert end_time == last_start
         assert close_time == last_close
+
+
+class TestSplitRange:
+    def test_no_split_without_range(self):
+        assert BinancePublicREST._split_range(TimeInterval._1m, None, None) == []
+        assert BinancePublicREST._split_range(TimeInterval._1m, 0, None) == []
+
+    def test_no_split_for_calendar_interval(self):
+        assert BinancePublicREST._split_range(TimeInterval._1M, 0, 10**12) == []
+
+    def test_split_into_1000_klines_windows(self):
+        minute = 60_000
+        windows = BinancePublicREST._split_range(TimeInterval._1m, 0, 2500 * minute - 1)
+
+        assert windows == [
+            (0, 1000 * minute - 1),
+            (1000 * minute, 2000 * minute - 1),
+            (2000 * minute, 2500 * minute - 1),
+        ]
+
+
+class TestHistoricalCandlesMany:
+    @staticmethod
+    def fetch(client: BinancePublicREST, requests: list) -> list:
+        async def run():
+            async with client:
+                return await client.get_historical_candles_many(requests)
+
+        return asyncio.run(run())
+
+    @staticmethod
+    def client(fail_start: int) -> BinancePublicREST:
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params["startTime"])
+            if start == fail_start:
+                return httpx.Response(500, content=b"down")
+            return httpx.Response(200, content=b"[]")
+
+        client = BinancePublicREST("https://api.binance.test")
+        client._http_pub_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    def test_failed_window_fails_the_range(self, btc_usdc_symbol):
+        minute = 60_000
+        request = {
+            "symbol": btc_usdc_symbol,
+            "interval": TimeInterval._1m,
+            "start_ts": 0,
+            "end_ts": 2500 * minute - 1,
+        }
+
+        (result,) = self.fetch(self.client(fail_start=1000 * minute), [request])
+
+        assert isinstance(result, httpx.HTTPStatusError)
+
+    def test_failed_request_is_returned_as_exception(self, btc_usdc_symbol):
+        requests = [
+            {"symbol": btc_usdc_symbol, "interval": TimeInterval._1m, "start_ts": 0},
+            {"symbol": btc_usdc_symbol, "interval": TimeInterval._1m, "start_ts": 1},
+        ]
+
+        ok, failed = self.fetch(self.client(fail_start=1), requests)
+
+        assert ok == [] and isinstance(failed, httpx.HTTPStatusError)
+
+
+class TestBuildKlinesParams:
+    def test_required_only(self, btc_usdc_symbol):
+        params = BinancePublicREST._build_klines_params(
+            btc_usdc_symbol, TimeInterval._1m, None, None, None, None
+        )
+
+        assert params == (("symbol", "BTCUSDC"), ("interval", "1m"))
+
+    def test_limit_clamp_and_epoch_start(self, btc_usdc_symbol):
+        params = BinancePublicREST._build_klines_params(
+            btc_usdc_symbol, TimeInterval._1m, -5000, 0, None, None
+        )
+
+        assert dict(params) == {
+            "symbol": "BTCUSDC",
+            "interval": "1m",
+            "limit": 1000,
+            "startTime": 0,
+        }
+
+
+class TestDecodeKlines:
+    body = (
+        b'[[1499040000000,"0.01634790","0.80000000","0.01575800","0.01577100",'
+        b'"148976.11427815",1499644799999,"2434.19055334",308,"1756.87402397",'
+        b'"28.46694368","0"]]'
+    )
+
+    def test_project_columns(self):
+        rows = BinancePublicREST._decode_klines(self.body, (0, 4))
+
+        assert rows == [[1499040000000, "0.01577100"]]
+
+    def test_full_klines_without_columns(self):
+        (kline,) = BinancePublicREST._decode_klines(self.body, None)
+
+        assert kline.open_time == 1499040000000
+        assert kline.number_of_trades == 308
+
+    def test_columnar_klines(self):
+        cols = BinancePublicREST._decode_klines_np(self.body)
+
+        assert cols.open_time.dtype == np.int64
+        assert cols.open_time.tolist() == [1499040000000]
+        assert cols.close_price.tolist() == [0.015771]
+        assert cols.number_of_trades.tolist() == [308]
+
+    def test_columnar_empty(self):
+        cols = BinancePublicREST._decode_klines_np(b"[]")
+
+        assert len(cols) == 0
+        assert cols.close_price.shape == (0,)
+
+    def test_columnar_scaled_klines(self):
+        cols = BinancePublicREST._decode_klines_np(self.body, scale=8)
+
+        assert cols.close_price.dtype == np.int64
+        assert cols.close_price.tolist() == [1577100]
+        assert cols.open_time.tolist() == [1499040000000]
+
+    def test_batch_item_is_kline(self):
+        (kline,) = BinancePublicREST._decode_klines(self.body, None)
+        batch = BinancePublicREST._decode_klines_np(self.body)
+        scaled = BinancePublicREST._decode_klines_np(self.body, scale=8)
+
+        assert batch[0].model_dump() == kline.model_dump()
+        assert scaled[0].model_dump() == kline.model_dump()
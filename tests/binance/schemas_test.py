@@ -0,0 +1,160 @@
+from decimal import Decimal
+
+import orjson
+
+from tf_strategy.binance.schemas import (
+    BalanceForAsset,
+    Kline,
+    Order,
+    OrderReport,
+    Symbol,
+)
+from tf_strategy.binance.ws._inner_ws_schemas import (
+    KlineEvent,
+    PublicSubscriptionCreator,
+)
+from tf_strategy.common.enums import Side, TimeInForce, TimeInterval, Type
+
+RAW_KLINE = [
+    1499040000000,
+    "0.01634790",
+    "0.80000000",
+    "0.01575800",
+    "0.01577100",
+    "148976.11427815",
+    1499644799999,
+    "2434.19055334",
+    308,
+    "1756.87402397",
+    "28.46694368",
+]
+
+
+class TestKline:
+    def test_from_list_matches_validated_kline(self):
+        validated = Kline.model_validate(
+            dict(zip("tohlcvTqnVQ", RAW_KLINE, strict=True))
+        )
+
+        assert Kline.from_list(RAW_KLINE) == validated
+
+    def test_kline_event_from_raw_frame(self):
+        raw = dict(zip("tohlcvTqnVQ", RAW_KLINE, strict=True))
+        frame = orjson.dumps(
+            {"e": "kline", "s": "BNBBTC", "k": raw | {"i": "1m", "x": True}}
+        )
+
+        event = KlineEvent.model_validate_json(frame)
+
+        assert event.symbol == "BNBBTC"
+        assert event.kline.time_interval is TimeInterval._1m
+        assert event.kline.is_closed is True
+        assert event.kline.close_price == 0.015771
+        assert not isinstance(event.kline, Kline)
+        assert event.kline.model_dump() == {
+            name: float(value) if isinstance(value, Decimal) else value
+            for name, value in Kline.from_list(RAW_KLINE).model_dump().items()
+        }
+
+
+class TestSubscriptionFrames:
+    def test_batch_subscription_msg(self):
+        streams = [
+            PublicSubscriptionCreator.kline_stream("BTCUSDT", TimeInterval._1m),
+            PublicSubscriptionCreator.kline_stream("ETHUSDT", "5m"),
+        ]
+
+        frame = PublicSubscriptionCreator.batch_subscription_msg(7, streams)
+
+        assert orjson.loads(frame) == {
+            "method": "SUBSCRIBE",
+            "id": 7,
+            "params": ["btcusdt@kline_1m", "ethusdt@kline_5m"],
+        }
+
+
+class TestOrderPayload:
+    def test_limit_order(self):
+        order = Order(
+            symbol=Symbol(first="BTC", second="USDT"),
+            side=Side.Buy,
+            type=Type.Limit,
+            time_in_force=TimeInForce.GTC,
+            quantity=Decimal("0.5"),
+            price=Decimal("100.10"),
+        )
+
+        assert Order.create_order_payload(order) == {
+            "symbol": "BTCUSDT",
+            "side": "BUY",
+            "type": "LIMIT",
+            "timeInForce": "GTC",
+            "quantity": "0.5",
+            "price": "100.10",
+        }
+
+    def test_market_order_by_quote_qty(self):
+        order = Order(
+            symbol=Symbol(first="BTC", second="USDT"),
+            side=Side.Sell,
+            type=Type.Market,
+            quote_order_qty=Decimal("25"),
+            new_client_order_id="abc",
+        )
+
+        assert Order.create_order_payload(order) == {
+            "symbol": "BTCUSDT",
+            "side": "SELL",
+            "type": "MARKET",
+            "quoteOrderQty": "25",
+            "newClientOrderId": "abc",
+        }
+
+
+class TestFromEvent:
+    def test_order_report_matches_validated(self):
+        event = {
+            "e": "executionReport",
+            "s": "ETHBTC",
+            "c": "mUvoqJxFIILMdfAW5iGSOW",
+            "S": "BUY",
+            "o": "LIMIT",
+            "f": "GTC",
+            "q": "1.00000000",
+            "p": "0.10264410",
+            "X": "NEW",
+            "i": 4293153,
+            "z": "0.00000000",
+            "T": 1499405658657,
+            "Z": "0.00000000",
+            "Q": "0.00000000",
+        }
+
+        assert OrderReport.from_event(event) == OrderReport.model_validate(event)
+
+    def test_balance_matches_validated(self):
+        raw = {"a": "ETH", "f": "10000.000000", "l": "0.000000"}
+
+        assert BalanceForAsset.from_event(raw) == BalanceForAsset.model_validate(raw)
+
+    def test_validate_many_keys_by_order_id(self):
+        raw = {
+            "symbol": "LTCBTC",
+            "orderId": 1,
+            "clientOrderId": "myOrder1",
+            "price": "0.1",
+            "origQty": "1.0",
+            "executedQty": "0.0",
+            "cummulativeQuoteQty": "0.0",
+            "status": "NEW",
+            "timeInForce": "GTC",
+            "type": "LIMIT",
+            "side": "BUY",
+            "stopPrice": "0.0",
+            "time": 1499827319559,
+            "isWorking": True,
+        }
+
+        reports = OrderReport.validate_many([raw])
+
+        assert reports == {"1": OrderReport.model_validate(raw)}
@@ -1,8 +1,9 @@
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
 import pytest
 
-from tf_strategy.binance.tools import tz_to_offset
+from tf_strategy.binance.tools import dt_to_ms, to_scaled_int, tz_to_offset
 
 
 class TestTzToOffset:
@@ -38,3 +39,36 @@ class TestTzToOffset:
     def test_boundary_offsets(self, tz_name, expected_offset, dt):
         offset = tz_to_offset(tz_name, dt)
         assert offset == expected_offset
+
+    def test_aware_datetime_uses_its_moment(self):
+        # Kyiv switches to summer time on 2025-03-30 at 01:00 UTC
+        winter = datetime(2025, 3, 30, 0, 30, tzinfo=ZoneInfo("UTC"))
+        summer = datetime(2025, 3, 30, 1, 30, tzinfo=ZoneInfo("UTC"))
+
+        assert tz_to_offset("Europe/Kyiv", winter) == "+02:00"
+        assert tz_to_offset("Europe/Kyiv", summer) == "+03:00"
+
+    def test_negative_offset_with_minutes(self):
+        dt = datetime(2025, 1, 1, 12, 0, 0)
+        assert tz_to_offset("America/St_Johns", dt) == "-03:30"
+
+
+class TestDtToMs:
+    def test_int_is_returned_as_is(self):
+        assert dt_to_ms(0) == 0
+        assert dt_to_ms(1764592200999) == 1764592200999
+
+    def test_datetime_with_milliseconds(self):
+        dt = datetime(2025, 12, 1, 12, 30, 0, 999_999, tzinfo=ZoneInfo("UTC"))
+        assert dt_to_ms(dt) == 1764592200999
+
+
+class TestToScaledInt:
+    def test_pads_and_truncates_fraction(self):
+        assert to_scaled_int("0.01577100", 8) == 1577100
+        assert to_scaled_int("148976.1", 3) == 148976100
+        assert to_scaled_int("1.23456", 2) == 123
+
+    def test_integer_and_negative_values(self):
+        assert to_scaled_int("42", 2) == 4200
+        assert to_scaled_int("-0.5", 1) == -5
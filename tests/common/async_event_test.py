@@ -0,0 +1,89 @@
+import asyncio
+
+from tf_strategy.common.async_event import AsyncEvent
+
+
+class TestAsyncEvent:
+    def test_emit_reaches_current_handlers(self):
+        calls = []
+
+        async def first(value):
+            calls.append(("first", value))
+
+        async def second(value):
+            calls.append(("second", value))
+
+        async def main():
+            event = AsyncEvent()
+            await event.add("1", first)
+            await event.add("2", second)
+            await event.emit(1)
+
+            await event.remove("1")
+            await event.emit(2)
+
+        asyncio.run(main())
+
+        assert calls == [("first", 1), ("second", 1), ("second", 2)]
+
+    def test_handler_removed_during_emit_keeps_snapshot(self):
+        calls = []
+
+        async def main():
+            event = AsyncEvent()
+
+            async def remover():
+                calls.append("remover")
+                await event.remove("2")
+
+            async def other():
+                calls.append("other")
+
+            await event.add("1", remover)
+            await event.add("2", other)
+            await event.emit()
+            await event.emit()
+
+            return event.is_empty()
+
+        assert asyncio.run(main()) is False
+        assert calls == ["remover", "other", "remover"]
+
+    def test_emit_without_handlers(self):
+        asyncio.run(AsyncEvent().emit(1))
+
+    def test_single_handler_gets_arguments(self):
+        calls = []
+
+        async def handler(*args, **kwargs):
+            calls.append((args, kwargs))
+
+        async def main():
+            event = AsyncEvent()
+            await event.add("1", handler)
+            await event.emit(1, kline="k")
+
+        asyncio.run(main())
+
+        assert calls == [((1,), {"kline": "k"})]
+
+    def test_failing_handler_doesnt_stop_others(self):
+        calls = []
+
+        async def failing(value):
+            raise RuntimeError(value)
+
+        async def handler(value):
+            calls.append(value)
+
+        async def main():
+            event = AsyncEvent()
+            await event.add("1", failing)
+            await event.emit(1)
+
+            await event.add("2", handler)
+            await event.emit(2)
+
+        asyncio.run(main())
+
+        assert calls == [2]
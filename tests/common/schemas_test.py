@@ -1,6 +1,11 @@
+from decimal import Decimal
+
 import pytest
+from pydantic import ValidationError
 
-from tf_strategy.common.schemas import Symbol
+from tf_strategy.binance.schemas import Symbol as BinanceSymbol
+from tf_strategy.common.enums import Side, Type
+from tf_strategy.common.schemas import Order, Symbol, make_symbol
 
 
 class TestSymbol:
@@ -37,3 +42,35 @@ class TestSymbol:
         s.set_format("{}-{}")
         assert s.symbol == "BNB-USD"
         assert s.r_symbol == "USD-BNB"
+
+    def test_of_matches_validated_symbol(self):
+        s = Symbol.of("ETH", "BTC")
+        assert s == Symbol(first="eth", second="btc")
+        assert s.symbol == "ETH/BTC"
+        assert s.r_symbol == "BTC/ETH"
+
+    def test_make_symbol_is_shared(self):
+        s = make_symbol("eth", "btc")
+        assert s is make_symbol("eth", "btc")
+        assert s == Symbol(first="ETH", second="BTC")
+
+    def test_symbol_is_slotted(self):
+        assert not hasattr(Symbol(first="eth", second="btc"), "__dict__")
+        assert not hasattr(BinanceSymbol(first="eth", second="btc"), "__dict__")
+
+
+class TestOrder:
+    values = {
+        "symbol": Symbol(first="BTC", second="USDT"),
+        "side": Side.Buy,
+        "type": Type.Market,
+        "quantity": Decimal("0.5"),
+    }
+
+    def test_trusted_matches_validated(self):
+        assert Order.trusted(**self.values) == Order(**self.values)
+
+    def test_order_is_frozen(self):
+        order = Order(**self.values)
+        with pytest.raises(ValidationError):
+            order.quantity = Decimal("1")
@@ -0,0 +1,27 @@
+from urllib.parse import urlencode
+
+import pytest
+
+from tf_strategy.common.tools import _query_string
+
+
+class TestQueryString:
+    def test_safe_payload_matches_urlencode(self):
+        payload = {"symbol": "BTCUSDT", "quantity": "0.5", "timestamp": 1499827319559}
+
+        assert _query_string(payload) == urlencode(payload)
+
+    def test_int_values_take_fast_path(self, monkeypatch):
+        monkeypatch.setattr(
+            "tf_strategy.common.tools.urlencode", lambda _: pytest.fail("quoted")
+        )
+        payload = {"symbol": "BTCUSDT", "recvWindow": 5000, "timestamp": 1499827319559}
+
+        assert _query_string(payload) == (
+            "symbol=BTCUSDT&recvWindow=5000&timestamp=1499827319559"
+        )
+
+    def test_unsafe_payload_is_quoted(self):
+        payload = {"symbol": "BTCUSDT", "newClientOrderId": "a b&c=d", "recvWindow": 5}
+
+        assert _query_string(payload) == urlencode(payload)
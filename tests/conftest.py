@@ -0,0 +1,28 @@
+from decimal import Decimal
+
+import pytest
+
+from tf_strategy.common.schemas import Kline
+
+
+@pytest.fixture(scope="session")
+def make_kline():
+    """Factory of the `i`-th one-minute kline, priced 100 + i."""
+
+    def make(i: int) -> Kline:
+        price = Decimal(100 + i)
+        return Kline(
+            open_time=i * 60_000,
+            open_price=price,
+            high_price=price + 1,
+            low_price=price - 1,
+            close_price=price,
+            volume=Decimal(10),
+            close_time=(i + 1) * 60_000 - 1,
+            quote_asset_volume=Decimal(0),
+            number_of_trades=1,
+            taker_buy_base_volume=Decimal(0),
+            taker_buy_quote_volume=Decimal(0),
+        )
+
+    return make
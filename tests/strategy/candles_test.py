@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from tf_strategy.strategy.candles import CandleWindow
+
+
+class TestCandleWindow:
+    def test_partial_window(self, make_kline):
+        window = CandleWindow.from_klines([make_kline(i) for i in range(3)], size=5)
+
+        assert len(window) == 3
+        np.testing.assert_array_equal(window["close"], [100.0, 101.0, 102.0])
+
+    @pytest.mark.parametrize("count", [5, 7, 10, 13])
+    def test_keeps_latest_in_order(self, make_kline, count):
+        window = CandleWindow.from_klines([make_kline(i) for i in range(count)], size=5)
+
+        assert len(window) == 5
+        np.testing.assert_array_equal(
+            window["close"], np.arange(count - 5, count) + 100.0
+        )
+        np.testing.assert_array_equal(window["high"], window["close"] + 1)
+        assert window.close_time[-1] == count * 60_000 - 1
+        assert window.last_close_time == count * 60_000 - 1
+
+    def test_empty_window(self):
+        window = CandleWindow(3)
+
+        assert len(window) == 0 and window.last_close_time is None
+        assert window["close"].shape == (0,)
+
+    def test_views_are_read_only(self, make_kline):
+        window = CandleWindow.from_klines([make_kline(0)], size=2)
+
+        with pytest.raises(ValueError):
+            window["close"][0] = 1.0
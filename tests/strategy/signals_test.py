@@ -0,0 +1,100 @@
+import numpy as np
+
+from tf_strategy.strategy.signals.adx import AdxBatch, adx, adx_numpy, adx_update
+from tf_strategy.strategy.signals.ema import ema_numba, ema_numba_dual, ema_scipy
+from tf_strategy.strategy.signals.sma import sma_numba, sma_numpy
+
+
+class TestSma:
+    def test_numba_matches_numpy(self):
+        price = np.random.default_rng(0).random(500) * 100
+
+        np.testing.assert_allclose(
+            sma_numba(price, 20), sma_numpy(price, 20), equal_nan=True
+        )
+
+    def test_numba_matches_numpy_on_gaps(self):
+        price = np.random.default_rng(0).random(200) * 100
+        price[50:60] = 1e9
+        price[60:70] = 0.0
+        price[[100, 120, 121, 150]] = np.nan, np.inf, -np.inf, -np.inf
+
+        result = sma_numba(price, 5)
+
+        np.testing.assert_array_equal(result, sma_numpy(price, 5))
+        assert (result[64:70] == 0.0).all() and np.isfinite(result[105:120]).all()
+
+    def test_period_longer_than_data(self):
+        assert np.isnan(sma_numba(np.ones(3), 5)).all()
+
+    def test_numpy_keeps_gaps_local(self):
+        price = np.random.default_rng(0).random(100) * 100
+        price[[30, 60]] = np.nan, np.inf
+        expected = np.full(100, np.nan)
+        expected[4:] = np.convolve(price, np.ones(5) / 5, mode="valid")
+
+        result = sma_numpy(price, 5)
+
+        np.testing.assert_allclose(result, expected, equal_nan=True)
+        assert np.isnan(result[30:35]).all() and np.isfinite(result[35:60]).all()
+
+
+class TestEma:
+    def test_numba_matches_scipy(self):
+        price = np.random.default_rng(0).random(500) * 100
+
+        np.testing.assert_allclose(
+            ema_numba(price, 20), ema_scipy(price, 20), equal_nan=True
+        )
+
+    def test_dual_matches_single(self):
+        price = np.random.default_rng(0).random(500) * 100
+
+        for period, result in zip((12, 26), ema_numba_dual(price, 12, 26), strict=True):
+            np.testing.assert_allclose(result, ema_numba(price, period), equal_nan=True)
+        assert np.isnan(ema_numba_dual(price, 12, 600)[1]).all()
+
+
+class TestAdx:
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(500).cumsum()
+    high = close + rng.random(500)
+    low = close - rng.random(500)
+
+    def test_kernel_matches_numpy(self):
+        high, low, close = self.high, self.low, self.close
+
+        for expected, result in zip(
+            adx_numpy(high, low, close, 14), adx(high, low, close, 14), strict=True
+        ):
+            np.testing.assert_allclose(result, expected, equal_nan=True)
+
+    def test_update_continues_batch(self):
+        high, low, close = self.high, self.low, self.close
+        batch = adx(high[:-1], low[:-1], close[:-1], 14)
+
+        result = adx_update(
+            high=high[-1],
+            prev_high=high[-2],
+            low=low[-1],
+            prev_low=low[-2],
+            prev_close=close[-2],
+            last_adx=batch.adx[-1],
+            last_trs=batch.trs[-1],
+            last_pdms=batch.pdms[-1],
+            last_mdms=batch.mdms[-1],
+            period=14,
+        )
+
+        expected = adx(high, low, close, 14)
+        np.testing.assert_allclose(result, [column[-1] for column in expected])
+
+    def test_float32_out(self):
+        high, low, close = self.high, self.low, self.close
+        out = AdxBatch(*np.zeros((4, len(close)), dtype=np.float32))
+
+        result = adx(high, low, close, 14, out=out)
+
+        assert result is out
+        for expected, column in zip(adx(high, low, close, 14), out, strict=True):
+            np.testing.assert_allclose(column, expected, rtol=1e-6, equal_nan=True)
@@ -0,0 +1,25 @@
+import numpy as np
+
+from tf_strategy.strategy.tools import cross_signals, crossed_above, crossed_below
+
+
+class TestCrossSignals:
+    def test_matches_masked_crosses(self):
+        rng = np.random.default_rng(0)
+        slow = rng.standard_normal(1000).cumsum()
+        # noise around the slow line crosses it often
+        fast = slow + rng.standard_normal(1000)
+        rsi = rng.random(1000) * 100
+        adx = rng.random(1000) * 50
+        rsi[:5] = adx[:10] = np.nan
+
+        entries = crossed_above(fast, slow) & (rsi < 30) & (adx > 25)
+        exits = crossed_below(fast, slow) & (rsi > 70)
+        expected = np.zeros(1000, dtype=np.int8)
+        expected[entries] = 1
+        expected[exits] = -1
+
+        assert (expected == 1).any() and (expected == -1).any()
+        result = cross_signals(fast, slow, rsi, adx, 25, 70, 30)
+
+        np.testing.assert_array_equal(result, expected)
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tf_strategy.strategy.base import TradeSignal
+from tf_strategy.strategy.signals.adx import adx_update
+from tf_strategy.strategy.signals.ema import ema_update
+from tf_strategy.strategy.signals.rsi import rsi_update
+from tf_strategy.strategy.trend_following import TrendFollowing, _tick_update
+
+
+class TestTickUpdate:
+    @pytest.mark.parametrize("close", [101.5, 98.25, 100.0])
+    def test_matches_update_functions(self, close):
+        prev_close = 100.0
+        high, low = np.array([101.0, close + 1]), np.array([99.0, close - 1])
+        last_fast, last_slow = 99.0, 97.5
+        gain, loss, leave_gain, leave_loss = 0.8, 0.6, 0.3, 0.9
+        last_adx = (22.0, 1.5, 0.7, 0.4)
+
+        result = _tick_update(
+            high,
+            low,
+            np.array([prev_close, close]),
+            last_fast,
+            last_slow,
+            gain,
+            loss,
+            leave_gain,
+            leave_loss,
+            *last_adx,
+            2 / 21,
+            2 / 51,
+            1 / 14,
+            20,
+        )
+
+        rsi = rsi_update(close - prev_close, gain, leave_gain, loss, leave_loss, 14)
+        adx_ = adx_update(high[1], high[0], low[1], low[0], prev_close, *last_adx, 20)
+        assert result == pytest.approx(
+            (
+                ema_update(close, last_fast, 2 / 21),
+                ema_update(close, last_slow, 2 / 51),
+                *rsi,
+                *adx_,
+            )
+        )
+
+
+class TestTrendFollowing:
+    def test_incremental_after_batch(self):
+        close = 100 + np.random.default_rng(0).standard_normal(500).cumsum()
+        data = pd.DataFrame({"high": close + 1, "low": close - 1, "close": close})
+        strategy = TrendFollowing()
+
+        strategy.update_batch(data.iloc[:-1])
+        strategy.update_incremental(data)
+
+        assert len(strategy.signals) == 100
+        assert strategy.signals[-1] in (-1, 0, 1)
+
+    def test_incremental_entry_signal(self):
+        # a long decline and a jump: the fast MA crosses above the slow one
+        close = np.append(np.linspace(200.0, 100.0, 200), 150.0)
+        data = pd.DataFrame({"high": close + 1, "low": close - 1, "close": close})
+        params = {
+            "fast_period": 2,
+            "slow_period": 5,
+            "adx_strength": 0,
+            "rsi_oversold": 100,
+        }
+        strategy = TrendFollowing(params)
+
+        strategy.update_batch(data.iloc[:-1])
+        strategy.update_incremental(data)
+
+        assert strategy.get_last_signal() is TradeSignal.OpenPosition
+
+    def test_incremental_before_batch(self):
+        close = np.linspace(100.0, 110.0, 10)
+        data = pd.DataFrame({"high": close + 1, "low": close - 1, "close": close})
+
+        with pytest.raises(RuntimeError, match="update_batch must run"):
+            TrendFollowing().update_incremental(data)
+
+    def test_incremental_reads_required_history_only(self):
+        close = 100 + np.random.default_rng(0).standard_normal(500).cumsum()
+        data = pd.DataFrame({"high": close + 1, "low": close - 1, "close": close})
+        full, windowed = TrendFollowing(), TrendFollowing()
+        full.update_batch(data.iloc[:-1])
+        windowed.update_batch(data.iloc[:-1])
+
+        full.update_incremental(data)
+        windowed.update_incremental(data.iloc[-windowed.required_history :])
+
+        assert full.signals == windowed.signals
+        assert full._signals.fast_ma == windowed._signals.fast_ma
+
+    def test_grid_matches_single_combinations(self):
+        close = 100 + np.random.default_rng(1).standard_normal(1000).cumsum()
+        high, low = close + 1, close - 1
+        fast, slow, rsi = np.array([[5, 20, 7], [10, 20, 14], [5, 30, 14]]).T
+        params = {
+            "adx_period": 14,
+            "adx_strength": 20,
+            "rsi_overbought": 60,
+            "rsi_oversold": 40,
+        }
+        strategy = TrendFollowing()
+
+        grid = strategy.generate_signals_grid(
+            high, low, close, fast, slow, rsi_period=rsi, **params
+        )
+
+        assert grid.shape == (3, 1000) and grid.any()
+        for row, f, s, r in zip(grid, fast, slow, rsi, strict=True):
+            expected = strategy.generate_signals(
+                high, low, close, f, s, rsi_period=r, **params
+            )
+            np.testing.assert_array_equal(row, expected)
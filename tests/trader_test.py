@@ -0,0 +1,127 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from tf_strategy.common.enums import Side, Status, TimeInterval, Type
+from tf_strategy.common.schemas import OrderReport, Symbol
+from tf_strategy.strategy.candles import CandleWindow
+from tf_strategy.strategy.trend_following import TrendFollowing
+from tf_strategy.trader import (
+    OpenPosition,
+    StrategyWorkerData,
+    TradeConfig,
+    Trader,
+    _init_candles,
+)
+
+
+def make_report(order_id: str, type_: Type, status: Status) -> OrderReport:
+    return OrderReport.model_construct(
+        order_id=order_id, type=type_, status=status, side=Side.Sell
+    )
+
+
+class StubConnector:
+    """Serves fixed history and records the subscriptions it is asked for."""
+
+    def __init__(self, klines):
+        self.klines = klines
+        self.requests = []
+        self.handlers = {}
+
+    async def get_historical_candles(self, symbol, interval, **kwargs):
+        self.requests.append((symbol, interval, kwargs))
+        return self.klines
+
+    async def kline_subscribe(self, symbol, time_interval, handler):
+        self.requests.append((symbol, time_interval))
+        self.handlers["kline"] = handler
+        return "kline-token"
+
+    async def orders_subscribe(self, handler):
+        self.handlers["orders"] = handler
+        return "orders-token"
+
+
+@pytest.fixture
+def config() -> TradeConfig:
+    return TradeConfig(
+        symbol=Symbol(first="BTC", second="USDT"),
+        max_open_positions=1,
+        quantity=Decimal("1"),
+        stop_loss=Decimal("0.02"),
+        take_profit=Decimal("0.05"),
+    )
+
+
+@pytest.fixture
+def worker(make_kline, config) -> StrategyWorkerData:
+    return StrategyWorkerData(
+        strategy=TrendFollowing(),
+        config=config,
+        connector=None,
+        candles=CandleWindow.from_klines([make_kline(0)], size=2),
+    )
+
+
+class TestStrategyWorker:
+    def test_filled_leg_closes_position(self, worker):
+        position = OpenPosition(
+            open_position=make_report("1", Type.Market, Status.Filled),
+            take_profit=make_report("2", Type.TakeProfit, Status.New),
+            stop_loss=make_report("3", Type.StopLoss, Status.New),
+        )
+        worker.open_positions["1"] = position
+        worker.positions_by_leg_id.update({"2": position, "3": position})
+
+        filled = make_report("3", Type.StopLoss, Status.Filled)
+        asyncio.run(worker.on_order_report(order_report=filled))
+
+        assert worker.open_positions == {} and worker.positions_by_leg_id == {}
+
+    def test_unknown_leg_is_ignored(self, worker):
+        filled = make_report("9", Type.TakeProfit, Status.Filled)
+        asyncio.run(worker.on_order_report(order_report=filled))
+
+        assert worker.open_positions == {}
+
+    def test_redelivered_candle_is_dropped(self, worker, make_kline):
+        asyncio.run(worker.on_kline(kline=make_kline(0), is_closed=True))
+
+        assert len(worker.candles) == 1
+
+
+class TestTrader:
+    def test_init_candles_without_history(self):
+        candles = _init_candles([], TrendFollowing())
+
+        assert len(candles) == 0
+
+    def test_create_strategy_worker(self, config, make_kline):
+        connector = StubConnector([make_kline(i) for i in range(60)])
+        trader = Trader()
+
+        token = asyncio.run(
+            trader.create_strategy_worker(
+                strategy=TrendFollowing(),
+                config=config,
+                connector=connector,
+                timeframe=TimeInterval._1m,
+            )
+        )
+
+        worker = trader._workers[token]
+        assert token == "kline-token"
+        assert connector.requests == [
+            (config.symbol, TimeInterval._1m, {}),
+            (config.symbol, TimeInterval._1m),
+        ]
+        assert connector.handlers == {
+            "kline": worker.on_kline,
+            "orders": worker.on_order_report,
+        }
+        assert worker.extra == {
+            "kline_subscribe": "kline-token",
+            "open_orders": "orders-token",
+        }
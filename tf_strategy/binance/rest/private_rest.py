@@ -1,12 +1,16 @@
+import asyncio
 import logging
 import time
-from collections.abc import Generator
+from contextlib import suppress
+from importlib.util import find_spec
 
 import httpx
 import orjson
 from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+from pydantic import TypeAdapter
 
 from tf_strategy.binance.schemas import (
+    BalanceForAsset,
     CancelOrder,
     Order,
     OrderOCO,
@@ -20,17 +24,63 @@ from .rest_paths import rest_path
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexing is available only with `httpx[http2]` installed
+_HTTP2_SUPPORTED = find_spec("h2") is not None
+
+# validates the whole balances list in one pydantic-core call
+_BALANCES_ADAPTER = TypeAdapter(list[BalanceForAsset])
+
 
 class BinancePrivateREST:
+    # seconds between keep-alive pings, well within `keepalive_expiry`
+    KEEPALIVE_INTERVAL = 20.0
+
     def __init__(self, url: str, api_key: str, private_key: PrivateKeyTypes):
+        # account and order requests are sparse, so connections are kept
+        # alive long enough to skip the TLS handshake on the next order;
+        # over HTTP/2 a single multiplexed connection serves all of them
         self._http_client = httpx.AsyncClient(
             base_url=url,
             headers={
                 "X-MBX-APIKEY": api_key,
             },
+            http2=_HTTP2_SUPPORTED,
+            limits=httpx.Limits(
+                max_connections=1 if _HTTP2_SUPPORTED else 10,
+                max_keepalive_connections=1 if _HTTP2_SUPPORTED else 4,
+                keepalive_expiry=300.0,
+            ),
+            timeout=httpx.Timeout(10.0, connect=5.0),
         )
 
         self._private_key = private_key
+        self._keepalive_task: asyncio.Task | None = None
+
+    def start_keepalive(self):
+        """Keep the order connection warm with periodic unsigned pings.
+
+        The first ping opens the connection right away, so the first order
+        does not pay for the TLS handshake, and the next ones keep it from
+        being closed as idle between sparse orders.
+        """
+        if self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def stop_keepalive(self):
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._keepalive_task
+            self._keepalive_task = None
+
+    async def _keepalive_loop(self):
+        while True:
+            try:
+                res = await self._http_client.get(rest_path.public.ping)
+                res.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.warning("Keep-alive ping failed: %s", e)
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL)
 
     async def account_info(self) -> dict | None:
         """
@@ -89,7 +139,7 @@ class BinancePrivateREST:
 
             res.raise_for_status()
         except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to retrieve account information: {str(e)}")
+            logger.error("Failed to retrieve account information: %s", e)
             return None
 
         return orjson.loads(res.content)
@@ -107,7 +157,12 @@ class BinancePrivateREST:
         """
         account_info = (await self.account_info()) or {}
 
-        return Wallet(balance=account_info.get("balances", []))
+        balances = _BALANCES_ADAPTER.validate_python(
+            account_info.get("balances", []), by_name=True
+        )
+
+        # the balances list is turned into the asset map once, here
+        return Wallet.model_construct(balance={i.asset: i for i in balances})
 
     async def send_order(self, order: Order) -> OrderReport | None:
         """
@@ -141,12 +196,11 @@ class BinancePrivateREST:
 
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to send order: {str(e)}")
+            logger.error("Failed to send order: %s", e)
             return None
 
-        raw = orjson.loads(resp.content)
-        report = OrderReport.model_validate(raw)
-        return report
+        # parsed and validated in a single pydantic-core call
+        return OrderReport.model_validate_json(resp.content)
 
     async def send_oco_order(
         self, order: OrderOCO
@@ -182,7 +236,7 @@ class BinancePrivateREST:
 
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to send OCO order: {str(e)}")
+            logger.error("Failed to send OCO order: %s", e)
             return None
 
         raw = orjson.loads(resp.content)
@@ -192,7 +246,7 @@ class BinancePrivateREST:
 
     async def get_open_orders(
         self, symbol: Symbol | None = None
-    ) -> Generator[None, None, OrderReport]:
+    ) -> dict[str, OrderReport] | None:
         """
         Retrieve all open orders for the account.
 
@@ -206,9 +260,8 @@ class BinancePrivateREST:
                 all symbols will be returned. Defaults to None.
 
         Returns:
-            Generator[None, None, OrderReport]:
-                A generator that yields validated OrderReport objects for each
-                open order.
+            dict[str, OrderReport]:
+                OrderReport objects of open orders keyed by order id.
 
         Raises:
             HTTPStatusError: If the HTTP request fails, the error is logged and
@@ -228,10 +281,10 @@ class BinancePrivateREST:
 
             res.raise_for_status()
         except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to get open orders: {str(e)}")
+            logger.error("Failed to get open orders: %s", e)
             return None
 
-        return (OrderReport.model_validate(i) for i in orjson.loads(res.content))
+        return OrderReport.validate_many(orjson.loads(res.content))
 
     async def cancel_order(self, order: CancelOrder) -> OrderReport | None:
         """
@@ -266,7 +319,7 @@ class BinancePrivateREST:
             res.raise_for_status()
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to cancel order: {str(e)}")
+            logger.error("Failed to cancel order: %s", e)
             return None
 
-        return OrderReport.model_validate(orjson.loads(res.content))
+        return OrderReport.model_validate_json(res.content)
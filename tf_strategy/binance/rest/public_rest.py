@@ -1,22 +1,94 @@
+import asyncio
 import logging
 from datetime import datetime
+from importlib.util import find_spec
+from typing import Any
 
 import httpx
+import numpy as np
 import orjson
 
 from tf_strategy.common.enums import TimeInterval
-from tf_strategy.common.schemas import Kline, Symbol
+from tf_strategy.common.schemas import Kline, KlineBatch, Symbol
 
 from ..schemas import Kline as BinanceKline
-from ..tools import dt_to_ms, tz_to_offset
+from ..tools import dt_to_ms, to_scaled_int, tz_to_offset
 from .rest_paths import rest_path
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexing is available only with `httpx[http2]` installed
+_HTTP2_SUPPORTED = find_spec("h2") is not None
+
+# lazy column projection is available only with `pysimdjson` installed
+if find_spec("simdjson") is not None:
+    import simdjson
+else:
+    simdjson = None
+
+
+# request errors that are logged and reported as an empty result,
+# `get_historical_candles_many` hands them back as exceptions instead
+_FETCH_ERRORS = (httpx.HTTPStatusError, httpx.TimeoutException)
+
+
+# raw kline field index and dtype of every column of the columnar klines
+_KLINE_COLUMNS: tuple[tuple[str, int, type], ...] = (
+    ("open_time", 0, np.int64),
+    ("open_price", 1, np.float64),
+    ("high_price", 2, np.float64),
+    ("low_price", 3, np.float64),
+    ("close_price", 4, np.float64),
+    ("volume", 5, np.float64),
+    ("close_time", 6, np.int64),
+    ("quote_asset_volume", 7, np.float64),
+    ("number_of_trades", 8, np.int64),
+    ("taker_buy_base_volume", 9, np.float64),
+    ("taker_buy_quote_volume", 10, np.float64),
+)
+
 
 class BinancePublicREST:
-    def __init__(self, url: str):
-        self._http_pub_client = httpx.AsyncClient(base_url=url)
+    # max number of klines returned by a single request
+    _KLINES_LIMIT = 1000
+    # bodies larger than this are decoded on a worker thread
+    _THREAD_DECODE_BYTES = 64 * 1024
+    # max number of error response bytes put into logs
+    _ERROR_BODY_LIMIT = 512
+
+    def __init__(self, url: str, concurrency: int = 10):
+        """
+        Args:
+            url (str): Base URL for Binance REST API.
+            concurrency (int): Max number of in-flight requests issued by
+                `get_historical_candles_many`. Keep it within the per-IP
+                request weight budget.
+        """
+        # a single client is shared by all requests,
+        # so the connection pool is reused between calls
+        self._http_pub_client = httpx.AsyncClient(
+            base_url=url,
+            http2=_HTTP2_SUPPORTED,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        )
+        self._sem = asyncio.Semaphore(concurrency)
+        # absolute endpoint URLs are not re-joined with `base_url` per request
+        self._klines_url = httpx.URL(url.rstrip("/") + rest_path.public.klines)
+
+    async def __aenter__(self) -> BinancePublicREST:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP client and its connection pool."""
+        await self._http_pub_client.aclose()
 
     async def get_historical_candles(
         self,
@@ -27,7 +99,8 @@ class BinancePublicREST:
         start_ts: datetime | int | None = None,
         end_ts: datetime | int | None = None,
         timezone: str | None = None,
-    ) -> list[Kline]:
+        columns: tuple[int, ...] | None = None,
+    ) -> list[Kline] | list[list[Any]]:
         """
         Fetch historical kline/candlestick bars for a symbol.
 
@@ -50,12 +123,16 @@ class BinancePublicREST:
             start_ts (datetime, optional): Start time in UTC. Defaults to None.
             end_ts (datetime, optional): End time in UTC. Defaults to None.
             timezone (str, optional): Timezone used to interpret kline intervals. Defaults to UTC.
+            columns (tuple[int, ...], optional): Raw kline field indices to return
+                instead of `Kline` objects, e.g. (0, 4) for open time and close.
+                Defaults to None.
 
         Raises:
             Exception: Raised when an unexpected error occurs.
 
         Returns:
-            list: List of klines, where each kline is represented as:
+            list: List of klines. If `columns` is set, every kline is a list
+                of the requested fields of the raw kline:
                 [
                     1499040000000, "0.01634790", "0.80000000",
                     "0.01575800", "0.01577100", "148976.11427815",
@@ -63,79 +140,344 @@ class BinancePublicREST:
                     "1756.87402397", "28.46694368", "0"
                 ]
         """
-        klines: list[Kline] = []
+        params = self._build_klines_params(
+            symbol, interval, limit, start_ts, end_ts, timezone
+        )
+        try:
+            return await self._get_klines(symbol, interval, params, columns)
+        except _FETCH_ERRORS:
+            # already logged by `_fetch_klines`
+            return []
 
-        params = {
-            "symbol": symbol.symbol,
-            "interval": interval.value,
-        }
+    async def get_historical_candles_raw(
+        self,
+        symbol: Symbol,
+        interval: TimeInterval,
+        *,
+        limit: int | None = None,
+        start_ts: datetime | int | None = None,
+        end_ts: datetime | int | None = None,
+        timezone: str | None = None,
+    ) -> bytes:
+        """
+        Fetch historical klines as the undecoded JSON body.
 
-        if limit:
-            original_limit = limit
-            if limit < 0:
-                logger.warning(
-                    "limit parameter must be greater than zero, converting to positive",
-                    extra={"original_limit": original_limit},
-                )
-                limit = abs(limit)
-            if limit > 1000:
-                logger.warning(
-                    "limit parameter must be <= 1000, capping to 1000",
-                    extra={"original_limit": original_limit},
+        Takes the same arguments as `get_historical_candles`. Useful for
+        consumers that forward klines or parse them on their own.
+
+        Returns:
+            bytes: JSON array of raw klines, b"[]" if the request failed.
+        """
+        params = self._build_klines_params(
+            symbol, interval, limit, start_ts, end_ts, timezone
+        )
+        try:
+            return bytes(await self._fetch_klines(symbol, interval, params))
+        except _FETCH_ERRORS:
+            return b"[]"
+
+    async def get_historical_candles_np(
+        self,
+        symbol: Symbol,
+        interval: TimeInterval,
+        *,
+        limit: int | None = None,
+        start_ts: datetime | int | None = None,
+        end_ts: datetime | int | None = None,
+        timezone: str | None = None,
+        scale: int | None = None,
+    ) -> KlineBatch:
+        """
+        Fetch historical klines as columns of typed NumPy arrays.
+
+        Takes the same arguments as `get_historical_candles`, but instead of
+        `Kline` objects returns one array per `Kline` field. Times and number
+        of trades are `int64`, prices and volumes are `float64`.
+
+        Args:
+            scale (int, optional): If set, prices and volumes are exact `int64`
+                numbers of 10**-scale units instead of `float64`, e.g. with
+                scale=8 "0.01577100" becomes 1577100. Defaults to None.
+
+        Returns:
+            KlineBatch: Klines by column, e.g. `batch.close_price`.
+                Arrays are empty if the request failed.
+        """
+        params = self._build_klines_params(
+            symbol, interval, limit, start_ts, end_ts, timezone
+        )
+        try:
+            buf = await self._fetch_klines(symbol, interval, params)
+        except _FETCH_ERRORS:
+            buf = b"[]"
+
+        if len(buf) > self._THREAD_DECODE_BYTES:
+            return await asyncio.to_thread(self._decode_klines_np, buf, scale)
+        return self._decode_klines_np(buf, scale)
+
+    @staticmethod
+    def _decode_klines_np(
+        buf: bytes | bytearray, scale: int | None = None
+    ) -> KlineBatch:
+        """Decode a klines response body into typed columns."""
+        raw = orjson.loads(buf)
+        # transpose rows into columns once, numpy parses numeric strings itself
+        cols = list(zip(*raw, strict=True)) if raw else [()] * len(_KLINE_COLUMNS)
+
+        res = {}
+        for name, idx, dtype in _KLINE_COLUMNS:
+            if scale is not None and dtype is np.float64:
+                res[name] = np.fromiter(
+                    (to_scaled_int(v, scale) for v in cols[idx]),
+                    dtype=np.int64,
+                    count=len(cols[idx]),
                 )
-                limit = 1000
-            params["limit"] = limit
-        if start_ts:
-            if isinstance(start_ts, datetime):
-                params["startTime"] = dt_to_ms(start_ts)
-            else:
-                params["startTime"] = start_ts
-        if end_ts:
-            if isinstance(end_ts, datetime):
-                params["endTime"] = dt_to_ms(end_ts)
             else:
-                params["endTime"] = end_ts
-        if timezone:
-            params["timeZone"] = tz_to_offset(timezone)
+                res[name] = np.array(cols[idx], dtype=dtype)
+        return KlineBatch(**res, scale=scale)
+
+    async def _get_klines(
+        self,
+        symbol: Symbol,
+        interval: TimeInterval,
+        params: tuple[tuple[str, str | int], ...],
+        columns: tuple[int, ...] | None,
+    ) -> list[Kline] | list[list[Any]]:
+        """Request and decode klines, request errors are raised."""
+        buf = await self._fetch_klines(symbol, interval, params)
+
+        if len(buf) > self._THREAD_DECODE_BYTES:
+            # don't hold the event loop while a large body is decoded
+            return await asyncio.to_thread(self._decode_klines, buf, columns)
+        return self._decode_klines(buf, columns)
 
+    async def _fetch_klines(
+        self,
+        symbol: Symbol,
+        interval: TimeInterval,
+        params: tuple[tuple[str, str | int], ...],
+    ) -> bytearray:
+        """Request klines and return the raw body, errors are logged and raised."""
+        sym, iv = symbol.symbol, interval.value
         try:
-            logger.debug("Requesting historical klines", extra={"params": params})
-            res = await self._http_pub_client.get(
-                url=rest_path.public.klines, params=params
-            )
-            res.raise_for_status()
-            klines = [BinanceKline.from_list(i[:-1]) for i in orjson.loads(res.content)]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Requesting historical klines", extra={"params": dict(params)}
+                )
+            async with self._http_pub_client.stream(
+                "GET", url=self._klines_url, params=params
+            ) as res:
+                if res.is_error:
+                    # the body is needed for the error report
+                    await res.aread()
+                res.raise_for_status()
+
+                # collect the body into a single buffer and parse it once,
+                # without keeping an extra copy inside the response
+                buf = bytearray()
+                async for chunk in res.aiter_bytes():
+                    buf.extend(chunk)
+
+            return buf
 
         except httpx.HTTPStatusError as e:
             logger.error(
                 "Couldn't get candles info",
                 extra={
                     "status_code": e.response.status_code,
-                    "response_text": e.response.text,
-                    "symbol": symbol.symbol,
-                    "interval": interval.value,
+                    # error bodies may be large, only their head is logged
+                    "response_text": e.response.content[
+                        : self._ERROR_BODY_LIMIT
+                    ].decode("utf-8", "replace"),
+                    "symbol": sym,
+                    "interval": iv,
                     "exception_id": id(e),
                 },
             )
+            raise
         except httpx.TimeoutException as e:
             logger.error(
                 "Timeout while fetching candles info",
                 extra={
-                    "symbol": symbol.symbol,
-                    "interval": interval.value,
+                    "symbol": sym,
+                    "interval": iv,
                     "exception_id": id(e),
                 },
             )
+            raise
         except Exception as e:
             logger.error(
                 "Unexpected error fetching candles info",
                 extra={
-                    "symbol": symbol.symbol,
-                    "interval": interval.value,
+                    "symbol": sym,
+                    "interval": iv,
                     "exception_type": type(e).__name__,
                     "exception_id": id(e),
                 },
             )
             raise
 
-        return klines
+    @staticmethod
+    def _decode_klines(
+        buf: bytes | bytearray, columns: tuple[int, ...] | None
+    ) -> list[Kline] | list[list[Any]]:
+        """Decode a klines response body, projecting `columns` if given."""
+        if columns is None:
+            return [BinanceKline.from_list(i[:-1]) for i in orjson.loads(buf)]
+
+        if simdjson is not None:
+            # only the requested fields are turned into python objects
+            doc = simdjson.Parser().parse(bytes(buf))
+            return [[row[c] for c in columns] for row in doc]
+
+        return [[row[c] for c in columns] for row in orjson.loads(buf)]
+
+    @classmethod
+    def _build_klines_params(
+        cls,
+        symbol: Symbol,
+        interval: TimeInterval,
+        limit: int | None,
+        start_ts: datetime | int | None,
+        end_ts: datetime | int | None,
+        timezone: str | None,
+    ) -> tuple[tuple[str, str | int], ...]:
+        """
+        Build klines query parameters as ready-to-encode pairs.
+
+        Args:
+            symbol (Symbol): Trading symbol.
+            interval (TimeInterval): Kline interval.
+            limit (int | None): Number of klines, clamped to 1..1000.
+            start_ts (datetime | int | None): Start time.
+            end_ts (datetime | int | None): End time.
+            timezone (str | None): Timezone name.
+
+        Returns:
+            tuple: Query parameter pairs in request order.
+        """
+        params: tuple[tuple[str, str | int], ...] = (
+            ("symbol", symbol.symbol),
+            ("interval", interval.value),
+        )
+
+        if limit:
+            clamped = min(cls._KLINES_LIMIT, abs(limit))
+            if clamped != limit:
+                if limit < 0:
+                    logger.warning(
+                        "limit parameter must be greater than zero, "
+                        "converting to positive",
+                        extra={"original_limit": limit},
+                    )
+                if abs(limit) > cls._KLINES_LIMIT:
+                    logger.warning(
+                        "limit parameter must be <= 1000, capping to 1000",
+                        extra={"original_limit": limit},
+                    )
+            params += (("limit", clamped),)
+        if start_ts is not None:
+            params += (("startTime", dt_to_ms(start_ts)),)
+        if end_ts is not None:
+            params += (("endTime", dt_to_ms(end_ts)),)
+        if timezone:
+            params += (("timeZone", tz_to_offset(timezone)),)
+
+        return params
+
+    async def get_historical_candles_many(
+        self, requests: list[dict[str, Any]]
+    ) -> list[list[Kline] | BaseException]:
+        """
+        Fetch historical klines for several symbols/intervals concurrently.
+
+        Every item of `requests` contains keyword arguments for
+        `get_historical_candles`. If both `start_ts` and `end_ts` are set,
+        the range is split into windows of 1000 klines which are fetched
+        concurrently as well. The number of in-flight requests is bounded
+        by the `concurrency` passed to the constructor.
+
+        Args:
+            requests (list[dict]): List of `get_historical_candles` kwargs, e.g.:
+                [
+                    {"symbol": btc_usdt, "interval": TimeInterval._1m},
+                    {"symbol": eth_usdt, "interval": TimeInterval._1h, "limit": 100},
+                ]
+
+        Returns:
+            list: Klines for every request in the same order as `requests`.
+                A failed request is represented by the raised exception,
+                e.g. `httpx.HTTPStatusError`. A split range fails as a whole
+                if any of its windows fails, so no result has gaps.
+        """
+        return await asyncio.gather(
+            *(self._get_historical_candles_range(**req) for req in requests),
+            return_exceptions=True,
+        )
+
+    async def _get_historical_candles_range(self, **kwargs) -> list[Kline]:
+        """Fetch klines, splitting a long [start_ts, end_ts] range into windows.
+
+        Raises the error of the first failed window instead of returning
+        a range with a gap.
+        """
+        windows = self._split_range(
+            kwargs["interval"], kwargs.get("start_ts"), kwargs.get("end_ts")
+        )
+        if len(windows) <= 1:
+            return await self._limited_historical_candles(**kwargs)
+
+        parts = await asyncio.gather(
+            *(
+                self._limited_historical_candles(
+                    **{
+                        **kwargs,
+                        "limit": self._KLINES_LIMIT,
+                        "start_ts": start,
+                        "end_ts": end,
+                    }
+                )
+                for start, end in windows
+            ),
+            return_exceptions=True,
+        )
+        # every window is awaited, then the first failed one fails the range
+        for part in parts:
+            if isinstance(part, BaseException):
+                raise part
+        return [kline for part in parts for kline in part]
+
+    async def _limited_historical_candles(
+        self,
+        symbol: Symbol,
+        interval: TimeInterval,
+        *,
+        limit: int | None = None,
+        start_ts: datetime | int | None = None,
+        end_ts: datetime | int | None = None,
+        timezone: str | None = None,
+        columns: tuple[int, ...] | None = None,
+    ) -> list[Kline] | list[list[Any]]:
+        """`get_historical_candles` under the semaphore, raising request errors."""
+        params = self._build_klines_params(
+            symbol, interval, limit, start_ts, end_ts, timezone
+        )
+        async with self._sem:
+            return await self._get_klines(symbol, interval, params, columns)
+
+    @classmethod
+    def _split_range(
+        cls,
+        interval: TimeInterval,
+        start_ts: datetime | int | None,
+        end_ts: datetime | int | None,
+    ) -> list[tuple[int, int]]:
+        """Split [start_ts, end_ts] into windows with at most 1000 klines each."""
+        step = interval.milliseconds
+        if start_ts is None or end_ts is None or step is None:
+            return []
+
+        start, end = dt_to_ms(start_ts), dt_to_ms(end_ts)
+
+        window = step * cls._KLINES_LIMIT
+        return [(s, min(s + window - 1, end)) for s in range(start, end + 1, window)]
@@ -1,7 +1,10 @@
+from collections.abc import Callable
 from decimal import Decimal
-from typing import ClassVar
+from functools import lru_cache
+from types import NoneType
+from typing import Any, get_args, get_origin
 
-from pydantic import AliasChoices, ConfigDict, Field, model_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from tf_strategy.common.enums import Side, Status, TimeInForce, Type
 from tf_strategy.common.schemas import BalanceForAsset as CommonBalanceForAsset
@@ -14,11 +17,34 @@ from tf_strategy.common.schemas import PartialyFill as CommonPartialyFill
 from tf_strategy.common.schemas import Symbol as CommonSymbol
 from tf_strategy.common.schemas import Wallet as CommonWallet
 
+# local alias of the C implemented Decimal for kline hot paths
+_D = Decimal
+
+_new_object = object.__new__
+_set_attr = object.__setattr__
+
+
+def _construct(cls: type[BaseModel], values: dict, fields_set: set[str]) -> Any:
+    """Create a model from complete, trusted field values.
+
+    A leaner `model_construct` for models without extra or private
+    attributes: the values dict becomes the instance dict as is, no
+    defaults or aliases are looked up.
+    """
+    obj = _new_object(cls)
+    _set_attr(obj, "__dict__", values)
+    _set_attr(obj, "__pydantic_fields_set__", fields_set.copy())
+    _set_attr(obj, "__pydantic_extra__", None)
+    _set_attr(obj, "__pydantic_private__", None)
+    return obj
+
 
 class Symbol(CommonSymbol):
     """Binance Symbol"""
 
-    _fmt = "{}{}"
+    __slots__ = ()
+
+    _default_fmt = "{}{}"
 
 
 class Kline(CommonKline):
@@ -36,24 +62,29 @@ class Kline(CommonKline):
     taker_buy_base_volume: Decimal = Field(alias="V")
     taker_buy_quote_volume: Decimal = Field(alias="Q")
 
-    _kline_fields: ClassVar[tuple[str, ...]] = (
-        "t",  # open time
-        "o",  # open
-        "h",  # high
-        "l",  # low
-        "c",  # close
-        "v",  # volume
-        "T",  # close time
-        "q",  # quote asset volume
-        "n",  # number of trades
-        "V",  # taker buy base
-        "Q",  # taker buy quote
-    )
-
     @classmethod
     def from_list(cls, raw: list) -> Kline:
-        data = dict(zip(cls._kline_fields, raw, strict=True))
-        return cls.model_validate(data)
+        """Build a kline from a trusted REST kline row without validation."""
+        return _construct(
+            cls,
+            {
+                "open_time": raw[0],
+                "open_price": _D(raw[1]),
+                "high_price": _D(raw[2]),
+                "low_price": _D(raw[3]),
+                "close_price": _D(raw[4]),
+                "volume": _D(raw[5]),
+                "close_time": raw[6],
+                "quote_asset_volume": _D(raw[7]),
+                "number_of_trades": raw[8],
+                "taker_buy_base_volume": _D(raw[9]),
+                "taker_buy_quote_volume": _D(raw[10]),
+            },
+            _KLINE_FIELDS,
+        )
+
+
+_KLINE_FIELDS = set(Kline.model_fields)
 
 
 class BalanceForAsset(CommonBalanceForAsset):
@@ -63,53 +94,83 @@ class BalanceForAsset(CommonBalanceForAsset):
     free: Decimal = Field(alias="f")
     locked: Decimal = Field(alias="l")
 
+    @classmethod
+    def from_event(cls, raw: dict) -> BalanceForAsset:
+        """Build a balance from a trusted WS account update without validation."""
+        return cls.model_construct(
+            asset=raw["a"], free=_D(raw["f"]), locked=_D(raw["l"])
+        )
+
 
 class Wallet(CommonWallet):
     """Binance Wallet"""
 
     balance: dict[str, BalanceForAsset]
 
-    @model_validator(mode="before")
-    @classmethod
-    def build_balance_map(cls, data):
-        """
-        Convert Binance balances list into a dict keyed by asset symbol.
-        """
-        if isinstance(data["balance"], list):
-            data["balance"] = {item["asset"]: item for item in data["balance"]}
-        return data
-
 
-class Order(CommonOrder):
-    """Binance Order"""
+@lru_cache(maxsize=1024)
+def _dec_to_str(value: Decimal) -> str:
+    # orders tend to repeat the same prices and quantities
+    return str(value)
 
-    @classmethod
-    def create_order_payload(cls, self: CommonOrder) -> dict:
-        payload = {
-            "symbol": self.symbol.symbol,
-            "side": self.side.value,
-            "type": self.type.value,
-        }
 
-        if self.time_in_force:
-            payload["timeInForce"] = self.time_in_force.value
+def _order_payload_builder(
+    fields: tuple[tuple[str, str, Callable[[Any], str]], ...],
+) -> Callable[[CommonOrder], dict]:
+    """Create a payload builder which sends only `fields` of an order, if set.
 
-        if self.quantity:
-            payload["quantity"] = str(self.quantity)
+    Every field is given as (attribute name, payload key, converter).
+    """
 
-        if self.quote_order_qty:
-            payload["quoteOrderQty"] = str(self.quote_order_qty)
+    def build(order: CommonOrder) -> dict:
+        payload = {
+            "symbol": order.symbol.symbol,
+            "side": order.side.value,
+            "type": order.type.value,
+        }
+        for attr, key, convert in fields:
+            value = getattr(order, attr)
+            if value:
+                payload[key] = convert(value)
+        return payload
 
-        if self.price:
-            payload["price"] = str(self.price)
+    return build
+
+
+_QTY = (
+    ("quantity", "quantity", _dec_to_str),
+    ("quote_order_qty", "quoteOrderQty", _dec_to_str),
+)
+_TIME_IN_FORCE = (("time_in_force", "timeInForce", str),)
+_PRICE = (("price", "price", _dec_to_str),)
+_STOP_PRICE = (("stop_price", "stopPrice", _dec_to_str),)
+_CLIENT_ID = (("new_client_order_id", "newClientOrderId", str),)
+
+# fields accepted by Binance for every order type
+_ORDER_PAYLOAD_BUILDERS: dict[Type, Callable[[CommonOrder], dict]] = {
+    Type.Market: _order_payload_builder(_QTY + _CLIENT_ID),
+    Type.Limit: _order_payload_builder(_TIME_IN_FORCE + _QTY + _PRICE + _CLIENT_ID),
+    Type.StopLoss: _order_payload_builder(
+        _TIME_IN_FORCE + _QTY + _CLIENT_ID + _STOP_PRICE
+    ),
+    Type.StopLossLimit: _order_payload_builder(
+        _TIME_IN_FORCE + _QTY + _PRICE + _CLIENT_ID + _STOP_PRICE
+    ),
+    Type.TakeProfit: _order_payload_builder(
+        _TIME_IN_FORCE + _QTY + _CLIENT_ID + _STOP_PRICE
+    ),
+    Type.TakeProfitLimit: _order_payload_builder(
+        _TIME_IN_FORCE + _QTY + _PRICE + _CLIENT_ID + _STOP_PRICE
+    ),
+}
 
-        if self.new_client_order_id:
-            payload["newClientOrderId"] = self.new_client_order_id
 
-        if self.stop_price:
-            payload["stopPrice"] = self.stop_price
+class Order(CommonOrder):
+    """Binance Order"""
 
-        return payload
+    @classmethod
+    def create_order_payload(cls, self: CommonOrder) -> dict:
+        return _ORDER_PAYLOAD_BUILDERS[self.type](self)
 
 
 class OrderOCO(CommonOrderOCO):
@@ -174,6 +235,56 @@ class OrderReport(CommonOrderReport):
     side: Side | None = Field(default=None, alias="S")
     model_config = ConfigDict(coerce_numbers_to_str=True)
 
+    @classmethod
+    def from_event(cls, raw: dict) -> OrderReport:
+        """Build a report from a trusted WS execution report without validation."""
+        fields = _ORDER_REPORT_FIELDS
+        return cls.model_construct(
+            **{
+                field[0]: field[1](value)
+                for key, value in raw.items()
+                if (field := fields.get(key)) is not None
+            }
+        )
+
+    @classmethod
+    def validate_many(cls, raw_list: list[dict]) -> dict[str, OrderReport]:
+        """Build trusted REST order reports keyed by order id in a single pass."""
+        reports = {}
+        for raw in raw_list:
+            report = cls.from_event(raw)
+            reports[report.order_id] = report
+        return reports
+
+
+def _alias_table(model: type[BaseModel]) -> dict[str, tuple[str, Callable]]:
+    """Map every name and alias of `model` scalar fields to (field name, converter).
+
+    The converter is the field type itself, e.g. `Decimal` or `Status`.
+    """
+    table = {}
+    for name, info in model.model_fields.items():
+        types = [t for t in get_args(info.annotation) if t is not NoneType]
+        convert = types[0] if types else info.annotation
+        if get_origin(convert) is not None:
+            # containers (e.g. fills) are not plain scalars
+            continue
+
+        keys = [name]
+        if info.alias:
+            keys.append(info.alias)
+        if isinstance(info.validation_alias, AliasChoices):
+            keys.extend(c for c in info.validation_alias.choices if isinstance(c, str))
+        elif isinstance(info.validation_alias, str):
+            keys.append(info.validation_alias)
+
+        for key in keys:
+            table[key] = (name, convert)
+    return table
+
+
+_ORDER_REPORT_FIELDS = _alias_table(OrderReport)
+
 
 class CancelOrder(CommonCancelOrder):
     """Binance CancelOrder"""
@@ -1,16 +1,33 @@
-from datetime import datetime
+import time
+from datetime import UTC, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import pytz
 
 
+def _format_offset(total_minutes: int) -> str:
+    hours, minutes = divmod(abs(total_minutes), 60)
+    return f"{'-' if total_minutes < 0 else '+'}{hours:02d}:{minutes:02d}"
+
+
+# every offset accepted by Binance, from -12:00 to +14:00 in 15 minute steps
+_OFFSET_TABLE: dict[int, str] = {
+    m: _format_offset(m) for m in range(-12 * 60, 14 * 60 + 1, 15)
+}
+
+
 def tz_to_offset(tz_name: str, dt: datetime = None) -> str:
     """
     Convert a timezone name to a UTC offset string in ±HH:MM format.
 
+    Offsets only change on DST transitions, so results are cached
+    per timezone and per hour.
+
     Args:
         tz_name (str): Timezone name, e.g., 'Europe/Kyiv'.
-        dt (datetime, optional): Specific datetime to calculate the offset.
+        dt (datetime, optional): Specific moment to calculate the offset at.
+                                 A naive datetime is treated as UTC.
                                  Defaults to current time.
 
     Returns:
@@ -21,18 +38,44 @@ def tz_to_offset(tz_name: str, dt: datetime = None) -> str:
         '+03:00'
     """
     if dt is None:
-        dt = datetime.now()
-    local_dt = dt.replace(tzinfo=ZoneInfo(tz_name))
-    offset = local_dt.utcoffset()
-    total_minutes = int(offset.total_seconds() // 60)
-    hours = total_minutes // 60
-    minutes = abs(total_minutes % 60)
-    return f"{hours:+03d}:{minutes:02d}"
-
-
-def dt_to_ms(dt: datetime) -> int:
-    """Convert a datetime object to a POSIX timestamp in milliseconds."""
-    return int(dt.timestamp() * 1000 + dt.microsecond // 1000)
+        ts = time.time()
+    elif dt.tzinfo is None:
+        ts = dt.replace(tzinfo=UTC).timestamp()
+    else:
+        ts = dt.timestamp()
+    return _offset_for(tz_name, int(ts) // 3600)
+
+
+@lru_cache(maxsize=1024)
+def _offset_for(tz_name: str, hour_epoch: int) -> str:
+    """Return the UTC offset of `tz_name` at the given hour since epoch."""
+    at = datetime.fromtimestamp(hour_epoch * 3600, tz=ZoneInfo(tz_name))
+    total_minutes = int(at.utcoffset().total_seconds()) // 60
+    offset = _OFFSET_TABLE.get(total_minutes)
+    # historical local mean times may have offsets outside of the table
+    return offset if offset is not None else _format_offset(total_minutes)
+
+
+def dt_to_ms(dt: datetime | int) -> int:
+    """Convert a datetime object to a POSIX timestamp in milliseconds.
+
+    An int is treated as a timestamp in milliseconds and returned as is.
+    """
+    if type(dt) is int:
+        return dt
+    # whole seconds and milliseconds are converted separately
+    # to avoid float rounding errors
+    return int(dt.replace(microsecond=0).timestamp()) * 1000 + dt.microsecond // 1000
+
+
+def to_scaled_int(value: str, scale: int) -> int:
+    """Convert a decimal string to an integer number of 10**-scale units.
+
+    Digits beyond `scale` are truncated, e.g. ("1.23456", 2) -> 123.
+    The conversion is exact, no float is involved.
+    """
+    whole, _, frac = value.partition(".")
+    return int(whole + frac[:scale].ljust(scale, "0"))
 
 
 def ms_to_dt(timestamp: float, tz_name: str = None) -> datetime:
@@ -1,4 +1,7 @@
+import asyncio
+from collections import defaultdict
 from datetime import datetime
+from typing import Any
 
 from tf_strategy.common.async_event import AsyncHandler
 from tf_strategy.common.base import ConnectorBase
@@ -8,6 +11,7 @@ from tf_strategy.common.schemas import (
     CancelOrder,
     ConnectorConfig,
     Kline,
+    KlineBatch,
     Order,
     OrderOCO,
     OrderReport,
@@ -22,6 +26,17 @@ from .ws.public_ws import BinancePublicWS
 
 
 class BinanceWrapper(ConnectorBase):
+    __slots__ = (
+        "_public_rest",
+        "_private_rest",
+        "_public_ws",
+        "_private_ws",
+        "_wallet",
+        "_open_orders",
+        "_open_orders_by_symbol",
+        "_is_started",
+    )
+
     def __init__(self, config: ConnectorConfig, reconnect_delay: float = 5):
         """
         Initialize Binance exchange wrapper.
@@ -60,6 +75,10 @@ class BinanceWrapper(ConnectorBase):
 
         self._wallet: Wallet = Wallet(balance={})
         self._open_orders: dict[str, OrderReport] = {}
+        # the same open orders grouped by symbol
+        self._open_orders_by_symbol: defaultdict[str, dict[str, OrderReport]] = (
+            defaultdict(dict)
+        )
 
         self._is_started: bool = False
 
@@ -67,14 +86,15 @@ class BinanceWrapper(ConnectorBase):
         if not self._is_started:
             self._is_started = True
 
-            await self._public_ws.start()
-            await self._private_ws.start()
+            # connections are independent, so their handshakes overlap
+            await asyncio.gather(self._public_ws.start(), self._private_ws.start())
+
+            self._private_rest.start_keepalive()
 
             await self._private_ws.wallet_subscribe(self._update_wallet)
             await self._private_ws.orders_subscribe(self._update_order_reports)
 
-            await self._refresh_wallet()
-            await self._refresh_open_orders()
+            await asyncio.gather(self._refresh_wallet(), self._refresh_open_orders())
 
     async def stop(self):
         if self._is_started:
@@ -82,9 +102,11 @@ class BinanceWrapper(ConnectorBase):
 
             await self._public_ws.stop()
             await self._private_ws.stop()
+            await self._private_rest.stop_keepalive()
 
             self._wallet = Wallet(balance={})
             self._open_orders = {}
+            self._open_orders_by_symbol = defaultdict(dict)
 
     ###################
     ### Public REST ###
@@ -143,6 +165,57 @@ class BinanceWrapper(ConnectorBase):
             timezone=timezone,
         )
 
+    async def get_historical_candles_np(
+        self,
+        symbol: Symbol,
+        interval: TimeInterval,
+        *,
+        limit: int | None = None,
+        start_ts: datetime | int | None = None,
+        end_ts: datetime | int | None = None,
+        timezone: str | None = None,
+        scale: int | None = None,
+    ) -> KlineBatch:
+        """
+        Fetch historical klines as columns of typed NumPy arrays.
+
+        Takes the same arguments as `get_historical_candles`. If `scale` is set,
+        prices and volumes are exact `int64` numbers of 10**-scale units.
+
+        Returns:
+            KlineBatch: Klines by column, e.g. `batch.close_price`.
+        """
+        return await self._public_rest.get_historical_candles_np(
+            symbol=symbol,
+            interval=interval,
+            limit=limit,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            timezone=timezone,
+            scale=scale,
+        )
+
+    async def get_historical_candles_many(
+        self, requests: list[dict[str, Any]]
+    ) -> list[list[Kline] | BaseException]:
+        """
+        Fetch historical klines for several symbols/intervals concurrently.
+
+        Every item of `requests` contains keyword arguments for
+        `get_historical_candles`. Long [start_ts, end_ts] ranges are split
+        into windows of 1000 klines and fetched concurrently.
+
+        Args:
+            requests (list[dict]): List of `get_historical_candles` kwargs.
+
+        Returns:
+            list: Klines for every request in the same order as `requests`.
+                A failed request is represented by the raised exception,
+                e.g. `httpx.HTTPStatusError`. A split range fails as a whole
+                if any of its windows fails, so no result has gaps.
+        """
+        return await self._public_rest.get_historical_candles_many(requests)
+
     ####################
     ### Private REST ###
     ####################
@@ -261,7 +334,7 @@ class BinanceWrapper(ConnectorBase):
         if not symbol:
             return self._open_orders
 
-        return {k: v for k, v in self._open_orders.items() if v.symbol == symbol.symbol}
+        return self._open_orders_by_symbol.get(symbol.symbol, {})
 
     async def _refresh_wallet(self):
         """
@@ -284,8 +357,11 @@ class BinanceWrapper(ConnectorBase):
         request succeeds.
         """
         open_orders = await self._private_rest.get_open_orders()
-        if open_orders:
-            self._open_orders = {order.order_id: order for order in open_orders}
+        if open_orders is not None:
+            self._open_orders = open_orders
+            self._open_orders_by_symbol = defaultdict(dict)
+            for order in open_orders.values():
+                self._open_orders_by_symbol[order.symbol][order.order_id] = order
 
     #################
     ### Public WS ###
@@ -318,14 +394,15 @@ class BinanceWrapper(ConnectorBase):
                     async def handler(
                         symbol: str,
                         time_interval: str,
-                        kline: Kline,
+                        kline: StreamKline,
                         is_closed: bool,
                     ) -> None
 
                 Where:
                 - ``symbol`` is the upercase trading symbol (e.g. "BTCUSDT")
                 - ``time_interval`` is the kline interval string
-                - ``kline`` is the parsed Kline object
+                - ``kline`` is the parsed StreamKline, the fields of a Kline
+                  with float prices and volumes
                 - ``is_closed`` indicates whether the candle is final
 
         Returns:
@@ -387,7 +464,7 @@ class BinanceWrapper(ConnectorBase):
             str:
                 Unique handler token used to unsubscribe from the stream.
         """
-        await self._private_ws.wallet_subscribe(handler)
+        return await self._private_ws.wallet_subscribe(handler)
 
     async def wallet_unsubscribe(self, handler_token: str):
         """
@@ -415,7 +492,7 @@ class BinanceWrapper(ConnectorBase):
             str:
                 Unique handler token used to unsubscribe from the stream.
         """
-        await self._private_ws.orders_subscribe(handler)
+        return await self._private_ws.orders_subscribe(handler)
 
     async def orders_unsubscribe(self, handler_token: str):
         """
@@ -427,13 +504,17 @@ class BinanceWrapper(ConnectorBase):
         """
         await self._private_ws.orders_unsubscribe(handler_token)
 
-    async def _update_wallet(self, balances_for_asset: list[BalanceForAsset]):
-        for b in balances_for_asset:
-            self._wallet.balance[b.asset] = b
+    async def _update_wallet(self, balances_for_asset: dict[str, BalanceForAsset]):
+        self._wallet.balance.update(balances_for_asset)
 
     async def _update_order_reports(self, order_report: OrderReport):
         if order_report.status in [Status.Canceled, Status.Rejected, Status.Expired]:
             self._open_orders.pop(order_report.order_id)
+            if by_symbol := self._open_orders_by_symbol.get(order_report.symbol):
+                by_symbol.pop(order_report.order_id, None)
 
         else:
             self._open_orders[order_report.order_id] = order_report
+            self._open_orders_by_symbol[order_report.symbol][
+                order_report.order_id
+            ] = order_report
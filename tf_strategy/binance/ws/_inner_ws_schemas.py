@@ -1,73 +1,135 @@
-from collections import namedtuple
+import sys
 from collections.abc import Iterable
-from itertools import count
+from functools import lru_cache
+from typing import NamedTuple
 
-import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 from tf_strategy.common.enums import TimeInterval
 
 from ..schemas import Symbol
 
-KlineKey = namedtuple(
-    "KlineKey", ["symbol", "time_interval", "channel"], defaults=["kline"]
-)
+
+class KlineKey(NamedTuple):
+    """Key of a kline subscription, the key type itself names the channel"""
+
+    symbol: str
+    time_interval: str
+
+
+@lru_cache(maxsize=4096)
+def _lower_symbol(symbol: str) -> str:
+    # the symbol universe is bounded, so lowercased names are computed once
+    return sys.intern(symbol.lower())
 
 
 class WSKeyCreator:
     """Class for creating uniquely interpreted keys for each WS subscription"""
 
-    @classmethod
-    def kline_key(
-        cls, symbol: Symbol | str, time_interval: TimeInterval | str
-    ) -> KlineKey:
+    # one key instance per (symbol, interval) as passed by the caller,
+    # so repeated lookups (e.g. per kline message) don't allocate
+    _kline_keys: dict[tuple[str, str], KlineKey] = {}
+
+    @staticmethod
+    def symbol_key(symbol: Symbol | str) -> str:
+        """Return the symbol as stored in subscription keys."""
         if not isinstance(symbol, str):
             symbol = symbol.symbol
+        return _lower_symbol(symbol)
+
+    @staticmethod
+    def kline_key(symbol: Symbol | str, time_interval: TimeInterval | str) -> KlineKey:
+        if not isinstance(symbol, str):
+            symbol = symbol.symbol
+
+        keys = WSKeyCreator._kline_keys
+        key = keys.get((symbol, time_interval))
+        if key is None:
+            key = KlineKey(
+                symbol=_lower_symbol(symbol),
+                time_interval=sys.intern(str(time_interval)),
+            )
+            keys[(symbol, time_interval)] = key
+        return key
+
 
-        if not isinstance(time_interval, str):
-            time_interval = time_interval.value
+class StreamKline(BaseModel):
+    """Kline of a WS kline event with its stream-only fields
 
-        return KlineKey(symbol=symbol.lower(), time_interval=time_interval)
+    Same fields as `Kline`, but prices and volumes are parsed as floats:
+    streamed klines only feed the signals, which compute in float64
+    anyway, and parsing a float is cheaper than a Decimal. Not a `Kline`
+    subclass, so Decimal arithmetic is never done on it by mistake.
+    """
+
+    open_time: int = Field(alias="t")
+    open_price: float = Field(alias="o")
+    high_price: float = Field(alias="h")
+    low_price: float = Field(alias="l")
+    close_price: float = Field(alias="c")
+    volume: float = Field(alias="v")
+    close_time: int = Field(alias="T")
+    quote_asset_volume: float = Field(alias="q")
+    number_of_trades: int = Field(alias="n")
+    taker_buy_base_volume: float = Field(alias="V")
+    taker_buy_quote_volume: float = Field(alias="Q")
+
+    time_interval: TimeInterval = Field(alias="i", exclude=True)
+    is_closed: bool = Field(alias="x", exclude=True)
+
+    model_config = ConfigDict(validate_by_name=True)
+
+
+class KlineEvent(BaseModel):
+    """WS kline event, parsed straight from the raw frame by pydantic-core"""
+
+    symbol: str = Field(alias="s")
+    kline: StreamKline = Field(alias="k")
 
 
 class PublicSubscriptionCreator:
     """"""
 
-    _id = count(1)
-    _subscribe_core = {"method": "SUBSCRIBE"}
-    _unsubscribe_core = {"method": "UNSUBSCRIBE"}
+    # frames are formatted as bytes, stream names are plain ascii
+    # which never need JSON escaping
+    _subscribe_frame = b'{"method":"SUBSCRIBE","id":%d,"params":["%s@kline_%s"]}'
+    _unsubscribe_frame = b'{"method":"UNSUBSCRIBE","id":%d,"params":["%s@kline_%s"]}'
+    _batch_subscribe_frame = b'{"method":"SUBSCRIBE","id":%d,"params":[%s]}'
 
     @classmethod
-    def _new_core(cls, core: dict, params: Iterable[str]):
-        return {
-            **core,
-            "id": next(cls._id),
-            "params": list(params),
-        }
+    def batch_subscription_msg(cls, msg_id: int, streams: Iterable[str]) -> bytes:
+        """Subscribe to all `streams` with a single frame."""
+        return cls._batch_subscribe_frame % (
+            msg_id,
+            b",".join(b'"%s"' % stream.encode() for stream in streams),
+        )
 
     @classmethod
-    def _format_symbol(cls, symbol: Symbol | str):
-        if isinstance(symbol, str):
-            return symbol.lower()
-        return symbol.symbol.lower()
+    def kline_stream(
+        cls, symbol: Symbol | str, time_interval: TimeInterval | str
+    ) -> str:
+        return f"{cls._format_symbol(symbol)}@kline_{time_interval}"
+
+    @staticmethod
+    def _format_symbol(symbol: Symbol | str):
+        return _lower_symbol(symbol if isinstance(symbol, str) else symbol.symbol)
 
     @classmethod
     def kline_subscription_msg(
-        cls, symbol: Symbol | str, time_interval: TimeInterval | str
-    ):
-        return orjson.dumps(
-            cls._new_core(
-                cls._subscribe_core,
-                (f"{cls._format_symbol(symbol)}@kline_{time_interval}",),
-            )
-        ).decode()
+        cls, msg_id: int, symbol: Symbol | str, time_interval: TimeInterval | str
+    ) -> bytes:
+        return cls._subscribe_frame % (
+            msg_id,
+            cls._format_symbol(symbol).encode(),
+            str(time_interval).encode(),
+        )
 
     @classmethod
     def kline_unsubscription_msg(
-        cls, symbol: Symbol | str, time_interval: TimeInterval | str
-    ):
-        return orjson.dumps(
-            cls._new_core(
-                cls._unsubscribe_core,
-                (f"{cls._format_symbol(symbol)}@kline_{time_interval}",),
-            )
-        ).decode()
+        cls, msg_id: int, symbol: Symbol | str, time_interval: TimeInterval | str
+    ) -> bytes:
+        return cls._unsubscribe_frame % (
+            msg_id,
+            cls._format_symbol(symbol).encode(),
+            str(time_interval).encode(),
+        )
@@ -1,6 +1,6 @@
+import asyncio
 import logging
 import time
-from uuid import uuid4
 
 import orjson
 from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
@@ -16,6 +16,11 @@ logger = logging.getLogger(__name__)
 class BinancePrivateWS:
     """"""
 
+    # static frame, serialized once
+    _user_data_frame = orjson.dumps(
+        {'id': 'user_data_id', 'method': 'userDataStream.subscribe'}
+    )
+
     def __init__(
         self,
         url: str,
@@ -28,15 +33,26 @@ class BinancePrivateWS:
         self._private_key = private_key
         self._reconnect_delay = reconnect_delay
 
-        self._is_started = False
+        # set before the first await of `start`, so concurrent calls
+        # can't create a second listener
+        self._started = asyncio.Event()
         self._listener: AsyncWSListener | None = None
 
         self._wallet_eventer: AsyncEvent | None = None
         self._orders_eventer: AsyncEvent | None = None
 
+        # handler tokens are only compared within this client
+        self._last_token = 0
+
+        # user data event type -> its handler
+        self._event_dispatch = {
+            "executionReport": self._emit_order_report,
+            "outboundAccountPosition": self._emit_balances,
+        }
+
     async def start(self):
-        if not self._is_started:
-            self._is_started = True
+        if not self._started.is_set():
+            self._started.set()
             logger.info("Private Binance connection is starting ...")
             self._listener = AsyncWSListener(
                 url=self._url,
@@ -48,14 +64,18 @@ class BinancePrivateWS:
             self._wallet_eventer = AsyncEvent()
             self._orders_eventer = AsyncEvent()
 
-            await self._listener.start()
+            try:
+                await self._listener.start()
+            except ConnectionError:
+                self._started.clear()
+                raise
 
     async def stop(self):
-        if self._is_started:
-            self._is_started = False
+        if self._started.is_set():
+            self._started.clear()
             logger.info("Private Binance connection is stopping ...")
             await self._listener.stop()
-            self._listenert = None
+            self._listener = None
             self._wallet_eventer = None
             self._orders_eventer = None
 
@@ -68,16 +88,21 @@ class BinancePrivateWS:
 
         Args:
             handler (AsyncHandler):
-                Asynchronous callback invoked on each wallet event.
+                Asynchronous callback invoked on each wallet event with
+                ``balances_for_asset: dict[str, BalanceForAsset]`` keyed by asset.
 
         Returns:
             str:
                 Unique handler token used to unsubscribe from the stream.
         """
-        token = uuid4()
+        token = self._new_token()
         await self._wallet_eventer.add(token, handler)
         return token
 
+    def _new_token(self) -> str:
+        self._last_token += 1
+        return str(self._last_token)
+
     async def wallet_unsubscribe(self, handler_token: str):
         """
         Unsubscribe from Wallet events.
@@ -103,7 +128,7 @@ class BinancePrivateWS:
             str:
                 Unique handler token used to unsubscribe from the stream.
         """
-        token = uuid4()
+        token = self._new_token()
         await self._orders_eventer.add(token, handler)
         return token
 
@@ -131,59 +156,46 @@ class BinancePrivateWS:
                         {'apiKey': self._api_key, 'timestamp': int(time.time() * 1000)},
                     ),
                 }
-            ).decode()
+            )
         )
 
     async def _user_data_subscription(self):
-        await self._listener.send(
-            orjson.dumps(
-                {'id': 'user_data_id', 'method': 'userDataStream.subscribe'}
-            ).decode()
+        await self._listener.send(self._user_data_frame)
+
+    async def _emit_order_report(self, event: dict):
+        await self._orders_eventer.emit(order_report=OrderReport.from_event(event))
+
+    async def _emit_balances(self, event: dict):
+        await self._wallet_eventer.emit(
+            balances_for_asset={
+                i["a"]: BalanceForAsset.from_event(i) for i in event["B"]
+            }
         )
 
-    async def _msg_preprocessing(self, msg: str):
+    async def _msg_preprocessing(self, msg: bytes):
         msg: dict = orjson.loads(msg)
 
         if event := msg.get("event"):
-            match event["e"]:
-                case "executionReport":
-                    await self._orders_eventer.emit(
-                        order_report=OrderReport.model_validate(event)
-                    )
-
-                case "outboundAccountPosition":
-                    await self._wallet_eventer.emit(
-                        balances_for_asset=[
-                            BalanceForAsset.model_validate(i) for i in event["B"]
-                        ]
-                    )
+            if emit := self._event_dispatch.get(event["e"]):
+                await emit(event)
+            return
 
         # processing subscription msgs
-        if id := msg.get("id"):
-            match id:
-
-                # processing logon subscription msgs
-                case "logon_id":
-                    if msg["status"] == 200:
-                        await self._user_data_subscription()
-                    else:
-                        logger.error(
-                            "Failed to send auth message." "Try again..."
-                            if self._listener.is_connected
-                            else "WS connection not established." f": {msg}"
-                        )
-
-                        if self._listener.is_connected:
-                            await self._log_on_subscription()
-
-                # processing user_datas' subscription msgs
-                case "user_data_id":
-                    if msg["status"] != 200:
-                        logger.error(
-                            "Failed to subscribe on UserData." "Try again..."
-                            if self._listener.is_connected
-                            else "WS connection not established." f": {msg}"
-                        )
-
-                        if self._listener.is_connected:
-                            await self._user_data_subscription()
+        match msg.get("id"):
+            # processing logon subscription msgs
+            case "logon_id":
+                if msg["status"] == 200:
+                    await self._user_data_subscription()
+                elif self._listener.is_connected:
+                    logger.error("Failed to send auth message, retrying: %r", msg)
+                    await self._log_on_subscription()
+                else:
+                    logger.error("WS connection not established: %r", msg)
+
+            # processing user_datas' subscription msgs
+            case "user_data_id" if msg["status"] != 200:
+                if self._listener.is_connected:
+                    logger.error("Failed to subscribe on UserData, retrying: %r", msg)
+                    await self._user_data_subscription()
+                else:
+                    logger.error("WS connection not established: %r", msg)
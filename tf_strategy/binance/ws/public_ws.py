@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from uuid import uuid4
+from collections import defaultdict
 
 import orjson
 
@@ -7,8 +8,9 @@ from tf_strategy.common.async_event import AsyncEvent, AsyncHandler
 from tf_strategy.common.connection.ws_listener import AsyncWSListener
 from tf_strategy.common.enums import TimeInterval
 
-from ..schemas import Kline, Symbol
+from ..schemas import Symbol
 from ._inner_ws_schemas import (
+    KlineEvent,
     KlineKey,
     PublicSubscriptionCreator,
     WSKeyCreator,
@@ -16,6 +18,31 @@ from ._inner_ws_schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Binance puts the event type first, so kline frames can be recognized
+# without decoding them
+_KLINE_PREFIX = b'{"e":"kline"'
+# (un)subscription acks, e.g. {"result":null,"id":1}
+_RESULT_PREFIX = b'{"result"'
+
+# subscription key type -> builders of its (subscribe, unsubscribe) frames
+_FRAME_BUILDERS = {
+    KlineKey: (
+        lambda msg_id, key: PublicSubscriptionCreator.kline_subscription_msg(
+            msg_id, symbol=key.symbol, time_interval=key.time_interval
+        ),
+        lambda msg_id, key: PublicSubscriptionCreator.kline_unsubscription_msg(
+            msg_id, symbol=key.symbol, time_interval=key.time_interval
+        ),
+    ),
+}
+
+# subscription key type -> its stream name
+_STREAM_NAMES = {
+    KlineKey: lambda key: PublicSubscriptionCreator.kline_stream(
+        key.symbol, key.time_interval
+    ),
+}
+
 
 class BinancePublicWS:
     """Client for Binance public WebSocket subscriptions."""
@@ -31,15 +58,28 @@ class BinancePublicWS:
         self._url = url
         self._reconnect_delay = reconnect_delay
 
-        self._is_started = False
+        # set before the first await of `start`, so concurrent calls
+        # can't create a second listener
+        self._started = asyncio.Event()
         self._listener: AsyncWSListener | None = None
 
+        # request ids only have to be unique within a connection
+        self._msg_id = 0
+        # handler tokens are only compared within this client
+        self._last_token = 0
+
         self._subscriptions: dict[tuple, AsyncEvent] = {}
         """Dictionary of running subscriptions and its event handler.
 
         Key is created using WSKeyCreator.
         """
 
+        self._subscription_frames: dict[tuple, tuple[bytes, bytes]] = {}
+        """Encoded (subscribe, unsubscribe) frames of running subscriptions.
+
+        Built once per channel.
+        """
+
         self._handlers: dict[str, tuple] = {}
         """Dictionary for comparing the handler
         and the subscription to which it is subordinate.
@@ -47,25 +87,39 @@ class BinancePublicWS:
         Value is created using WSKeyCreator.
         """
 
+        self._channel_handlers: defaultdict[tuple, set[str]] = defaultdict(set)
+        """Reverse index of `_handlers`: handler tokens of each subscription."""
+
+        self._symbol_subscriptions: defaultdict[str, set[tuple]] = defaultdict(set)
+        """Index of `_subscriptions` by the lowercase symbol of the key."""
+
     async def start(self):
-        if not self._is_started:
-            self._is_started = True
+        if not self._started.is_set():
+            self._started.set()
             logger.info("Public Binance connection is starting ...")
             self._listener = AsyncWSListener(
                 url=self._url,
                 on_message=self._msg_preprocessing,
+                on_connected=self._resubscribe,
                 reconnect_delay=self._reconnect_delay,
             )
-            await self._listener.start()
+            try:
+                await self._listener.start()
+            except ConnectionError:
+                self._started.clear()
+                raise
 
     async def stop(self):
-        if self._is_started:
-            self._is_started = False
+        if self._started.is_set():
+            self._started.clear()
             logger.info("Public Binance connection is stopping ...")
             await self._listener.stop()
-            self._listenert = None
+            self._listener = None
             self._subscriptions.clear()
+            self._subscription_frames.clear()
             self._handlers.clear()
+            self._channel_handlers.clear()
+            self._symbol_subscriptions.clear()
 
     async def kline_subscribe(
         self,
@@ -95,14 +149,15 @@ class BinancePublicWS:
                     async def handler(
                         symbol: str,
                         time_interval: str,
-                        kline: Kline,
+                        kline: StreamKline,
                         is_closed: bool,
                     ) -> None
 
                 Where:
                 - ``symbol`` is the upercase trading symbol (e.g. "BTCUSDT")
                 - ``time_interval`` is the kline interval string
-                - ``kline`` is the parsed Kline object
+                - ``kline`` is the parsed StreamKline, the fields of a Kline
+                  with float prices and volumes
                 - ``is_closed`` indicates whether the candle is final
 
         Returns:
@@ -115,7 +170,8 @@ class BinancePublicWS:
         """
 
         subscr_key = WSKeyCreator.kline_key(symbol, time_interval)
-        token = str(uuid4())
+        self._last_token += 1
+        token = str(self._last_token)
 
         await self._subscribe(subscr_key, token, handler)
 
@@ -156,8 +212,10 @@ class BinancePublicWS:
         elif symbol:
             keys = [
                 key
-                for key in self._subscriptions
-                if key.symbol == symbol.symbol.lower() and key.channel == "kline"
+                for key in self._symbol_subscriptions.get(
+                    WSKeyCreator.symbol_key(symbol), ()
+                )
+                if type(key) is KlineKey
             ]
             for key in keys:
                 await self._unsubscribe(subscr_key=key)
@@ -175,12 +233,16 @@ class BinancePublicWS:
 
         # create a new connection if they doesnt exists
         if subscr_key not in self._subscriptions:
-            await self._listener.send(self._make_subscription_msg(subscr_key))
+            frames = self._make_subscription_frames(subscr_key)
+            await self._listener.send(frames[0])
+            self._subscription_frames[subscr_key] = frames
             self._subscriptions[subscr_key] = AsyncEvent()
+            self._symbol_subscriptions[subscr_key.symbol].add(subscr_key)
             is_new_channel = True
 
         # required to remove the handler by identifier
         self._handlers[handler_token] = subscr_key
+        self._channel_handlers[subscr_key].add(handler_token)
         await self._subscriptions[subscr_key].add(handler_token, handler)
 
         return is_new_channel
@@ -203,46 +265,80 @@ class BinancePublicWS:
                 return
 
             await eventer.remove(handler_token)
+            self._channel_handlers[subscr_key].discard(handler_token)
 
             if eventer.is_empty():
                 key_for_unsubscribe = subscr_key
+                self._channel_handlers.pop(subscr_key, None)
 
         elif subscr_key:
-            self._handlers = {k: v for k, v in self._handlers if v != subscr_key}
+            for token in self._channel_handlers.pop(subscr_key, ()):
+                self._handlers.pop(token, None)
 
         if key_for_unsubscribe:
-            self._subscriptions.pop(key_for_unsubscribe)
-            await self._listener.send(self._make_subscription_msg(subscr_key, False))
+            if self._subscriptions.pop(key_for_unsubscribe, None) is not None:
+                symbol_keys = self._symbol_subscriptions[key_for_unsubscribe.symbol]
+                symbol_keys.discard(key_for_unsubscribe)
+                if not symbol_keys:
+                    del self._symbol_subscriptions[key_for_unsubscribe.symbol]
+            frames = self._subscription_frames.pop(key_for_unsubscribe, None)
+            if frames:
+                await self._listener.send(frames[1])
             return True
         return False
 
-    def _make_subscription_msg(self, subscr_key: tuple, is_subscription: bool = True):
-        match subscr_key, is_subscription:
-            case KlineKey() as key, True:
-                return PublicSubscriptionCreator.kline_subscription_msg(
-                    symbol=key.symbol, time_interval=key.time_interval
-                )
-            case KlineKey() as key, False:
-                return PublicSubscriptionCreator.kline_unsubscription_msg(
-                    symbol=subscr_key.symbol, time_interval=subscr_key.time_interval
-                )
-            case _:
-                raise ValueError(f"Unknown subscription key: {subscr_key}")
+    async def _resubscribe(self):
+        """Resubscribe to all running subscriptions with a single frame."""
+        if not self._subscriptions:
+            return
+
+        self._msg_id += 1
+        await self._listener.send(
+            PublicSubscriptionCreator.batch_subscription_msg(
+                self._msg_id,
+                (_STREAM_NAMES[type(key)](key) for key in self._subscriptions),
+            )
+        )
+
+    def _make_subscription_frames(self, subscr_key: tuple) -> tuple[bytes, bytes]:
+        """Return the (subscribe, unsubscribe) frames of the subscription."""
+        builders = _FRAME_BUILDERS.get(type(subscr_key))
+        if builders is None:
+            raise ValueError(f"Unknown subscription key: {subscr_key}")
+
+        self._msg_id += 2
+        subscribe, unsubscribe = builders
+        return (
+            subscribe(self._msg_id - 1, subscr_key),
+            unsubscribe(self._msg_id, subscr_key),
+        )
+
+    async def _msg_preprocessing(self, msg: bytes):
+        # hot path: parse and validate a kline frame in one pydantic-core call
+        if msg.startswith(_KLINE_PREFIX):
+            await self._kline_preprocessor(KlineEvent.model_validate_json(msg))
+            return
+
+        # acks are only logged, so they are not parsed
+        if msg.startswith(_RESULT_PREFIX):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Subscription response: %s", msg.decode())
+            return
 
-    async def _msg_preprocessing(self, msg: str):
         msg = orjson.loads(msg)
 
         if "e" not in msg:
-            logger.debug(msg)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Non-event message: %r", msg)
             return
 
         if msg["e"] == "kline":
-            await self._kline_preprocessor(msg)
+            await self._kline_preprocessor(KlineEvent.model_validate(msg))
 
         else:
-            logger.warning(msg)
+            logger.warning("Unexpected event: %r", msg)
 
-    async def _kline_preprocessor(self, msg: dict):
+    async def _kline_preprocessor(self, event: KlineEvent):
         """
         {
             "e": "kline",         // Event type
@@ -269,10 +365,11 @@ class BinancePublicWS:
             }
         }
         """
-        subscr_key = WSKeyCreator.kline_key(msg["s"].lower(), msg["k"]["i"])
+        kline = event.kline
+        subscr_key = WSKeyCreator.kline_key(event.symbol, kline.time_interval)
         await self._subscriptions[subscr_key].emit(
-            symbol=msg["s"],
-            time_interval=TimeInterval(msg["k"]["i"]),
-            kline=Kline.model_validate(msg["k"]),
-            is_closed=msg["k"]["x"],
+            symbol=event.symbol,
+            time_interval=kline.time_interval,
+            kline=kline,
+            is_closed=kline.is_closed,
         )
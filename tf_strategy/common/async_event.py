@@ -1,14 +1,20 @@
 import asyncio
+import logging
 from collections.abc import Awaitable, Callable
 
 AsyncHandler = Callable[..., Awaitable[None]]
 
+logger = logging.getLogger(__name__)
+
 
 class AsyncEvent:
     """Class for asynchronous notification of all subscribers."""
 
     def __init__(self):
         self._handlers: dict[str, AsyncHandler] = {}
+        # immutable copy of the handlers, replaced on every add/remove,
+        # so emit can read it without taking the lock
+        self._snapshot: tuple[AsyncHandler, ...] = ()
         self._lock = asyncio.Lock()
 
     async def add(self, key: str, handler: AsyncHandler):
@@ -23,20 +29,38 @@ class AsyncEvent:
         async with self._lock:
             if key not in self._handlers:
                 self._handlers[key] = handler
+                self._snapshot = tuple(self._handlers.values())
 
     async def remove(self, key: str):
         """Remove the handler from the list."""
         async with self._lock:
-            self._handlers.pop(key, None)
+            if self._handlers.pop(key, None) is not None:
+                self._snapshot = tuple(self._handlers.values())
 
     async def emit(self, *args, **kwargs):
-        """ "Notifies all subscribers."""
-        async with self._lock:
-            handlers = list(self._handlers.values())  # snapshot
+        """Notifies all subscribers.
+
+        A failed handler is logged, the failure doesn't reach the other
+        handlers or the caller (e.g. the WS receive loop).
+        """
+        handlers = self._snapshot
+
+        # a single subscriber is the common case, no need for gather tasks
+        if len(handlers) == 1:
+            try:
+                await handlers[0](*args, **kwargs)
+            except Exception:
+                logger.exception("Event handler failed")
+            return
+        if not handlers:
+            return
 
-        await asyncio.gather(
-            *(handler(*args, **kwargs) for handler in handlers), return_exceptions=False
+        results = await asyncio.gather(
+            *(handler(*args, **kwargs) for handler in handlers), return_exceptions=True
         )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Event handler failed", exc_info=result)
 
     def is_empty(self) -> bool:
         """Checks whether subscribers exist."""
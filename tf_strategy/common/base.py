@@ -22,6 +22,9 @@ class ConnectorBase(ABC):
     through REST and WebSocket APIs.
     """
 
+    # lets implementations define their own slots
+    __slots__ = ()
+
     @abstractmethod
     async def start(self) -> None:
         """Start the connector and establish connections."""
@@ -151,7 +154,8 @@ class ConnectorBase(ABC):
             handler (AsyncHandler): Asynchronous callback invoked on each kline event.
 
         Returns:
-            str: Unique handler token used to unsubscribe from the stream.
+            str: Opaque handler token, unique within the connector,
+                used to unsubscribe from the stream.
         """
         ...
 
@@ -182,7 +186,8 @@ class ConnectorBase(ABC):
             handler (AsyncHandler): Asynchronous callback invoked on each wallet event.
 
         Returns:
-            str: Unique handler token used to unsubscribe from the stream.
+            str: Opaque handler token, unique within the connector,
+                used to unsubscribe from the stream.
         """
         ...
 
@@ -205,7 +210,8 @@ class ConnectorBase(ABC):
             handler (AsyncHandler): Asynchronous callback invoked on each order event.
 
         Returns:
-            str: Unique handler token used to unsubscribe from the stream.
+            str: Opaque handler token, unique within the connector,
+                used to unsubscribe from the stream.
         """
         ...
 
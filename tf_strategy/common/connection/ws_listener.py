@@ -1,6 +1,13 @@
 import asyncio
 import logging
+import random
+import socket
+import ssl
+import sys
+from collections import deque
+from collections.abc import Callable
 from contextlib import suppress
+from functools import cache
 
 import websockets
 
@@ -8,36 +15,114 @@ from ..async_event import AsyncHandler
 
 logger = logging.getLogger(__name__)
 
+# not exported by the socket module, the value is Linux specific
+_SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46) if sys.platform == "linux" else None
+
+
+@cache
+def _shared_ssl_context() -> ssl.SSLContext:
+    # loading the CA store is the costly part of a default context,
+    # so all wss connections and reconnects share a single one
+    return ssl.create_default_context()
+
+
+# listener states
+_STOPPED = 0
+_STARTED = 1
+_CONNECTED = 2
+
 
 class AsyncWSListener:
-    """Lightweight listener for WS connection."""
+    """Lightweight listener for WS connection.
+
+    Works on any asyncio event loop. The receive and send loops mostly
+    wait on loop primitives, so `tf_strategy.common.tools.run` is the
+    preferred entry point: it runs them on uvloop when it's installed.
+    """
+
+    __slots__ = (
+        "_url",
+        "_on_message_handler",
+        "_on_connected_handler",
+        "_on_error_handler",
+        "_on_close_handler",
+        "_reconnect_delay",
+        "_compression",
+        "_busy_poll",
+        "_buffered",
+        "_ssl",
+        "_backoff",
+        "_task",
+        "_send_task",
+        "_send_lock",
+        "_ws",
+        "_send_buf",
+        "_send_wakeup",
+        "_state",
+        "_state_changed",
+    )
+
+    # messages sent in a row before the send loop yields to the event loop
+    _MAX_SEND_BATCH = 64
+    # upper bound of the reconnect backoff, in seconds
+    _MAX_RECONNECT_DELAY = 60.0
 
     def __init__(
         self,
         url: str,
-        on_message: AsyncHandler,
+        on_message: AsyncHandler | Callable[[bytes], None],
         on_connected: AsyncHandler | None = None,
         on_error: AsyncHandler | None = None,
         on_close: AsyncHandler | None = None,
         reconnect_delay: float = 5.0,
+        compression: str | None = None,
+        busy_poll: int | None = None,
+        buffered: bool = False,
     ):
+        """
+        Args:
+            on_message (AsyncHandler | Callable[[bytes], None]):
+                Called with every received frame as raw bytes, text frames
+                included. JSON parsers such as orjson take them as is.
+            compression (str | None): WS compression extension to negotiate,
+                e.g. "deflate". Disabled by default: small JSON frames gain
+                little from it and every frame would be inflated on receive.
+            busy_poll (int | None): Microseconds the kernel busy polls the
+                socket for data before sleeping (SO_BUSY_POLL, Linux only).
+                Lowers receive latency at the cost of CPU; values above
+                the net.core.busy_read sysctl need CAP_NET_ADMIN.
+            buffered (bool): Queue outgoing messages for a dedicated send
+                task instead of sending them from the caller. Only worth it
+                for high-rate outbound traffic, as `send` doesn't wait for
+                the frame to be written then.
+        """
         self._url = url
         self._on_message_handler = on_message
         self._on_connected_handler = on_connected
         self._on_error_handler = on_error
         self._on_close_handler = on_close
         self._reconnect_delay = reconnect_delay
+        self._compression = compression
+        self._busy_poll = busy_poll
+        self._buffered = buffered
+        self._ssl = _shared_ssl_context() if url.startswith("wss://") else None
+        # grows with decorrelated jitter while reconnects keep failing,
+        # so many clients dropped at once don't reconnect in lockstep
+        self._backoff = reconnect_delay
 
         self._task: asyncio.Task | None = None
         self._send_task: asyncio.Task | None = None
 
         self._ws: websockets.ClientConnection | None = None
-        self._send_queue: asyncio.Queue[str | None] = asyncio.Queue()
-
-        self._start_event = asyncio.Event()
-        self._stop_event = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        # buffered mode only; the send loop is the only consumer, so a plain
+        # buffer and a wakeup event are enough, no Future per message as with asyncio.Queue
+        self._send_buf: deque[str | bytes | None] = deque()
+        self._send_wakeup = asyncio.Event()
 
-        self._stop_event.set()
+        self._state = _STOPPED
+        # notified when the listener gets connected
+        self._state_changed = asyncio.Condition()
 
     @property
     def url(self):
@@ -47,12 +132,12 @@ class AsyncWSListener:
     @property
     def is_started(self):
         """Return True if the listener is started."""
-        return not self._stop_event.is_set()
+        return self._state != _STOPPED
 
     @property
     def is_connected(self):
         """Return True if connection is open."""
-        return self._start_event.is_set()
+        return self._state == _CONNECTED
 
     async def _on_message(self, *args, **kwargs):
         if self._on_message_handler:
@@ -75,60 +160,129 @@ class AsyncWSListener:
             need_reconnect = False
             try:
                 async with websockets.connect(
-                    self.url, open_timeout=self._reconnect_delay
+                    self.url,
+                    open_timeout=self._reconnect_delay,
+                    compression=self._compression,
+                    ssl=self._ssl,
                 ) as ws:
                     self._ws = ws
+                    if self._busy_poll:
+                        self._set_busy_poll(ws)
                     await self._on_connected()
 
-                    self._start_event.set()  # signal about created connection
-
-                    # We launch a separate task for sending messages.
-                    self._send_task = asyncio.create_task(self._send_loop())
-                    async for msg in ws:
-                        await self._on_message_handler(msg)
+                    # signal about created connection
+                    async with self._state_changed:
+                        self._state = _CONNECTED
+                        self._state_changed.notify_all()
+                    self._backoff = self._reconnect_delay
+
+                    if self._buffered:
+                        # a separate task sends the queued messages,
+                        # including the ones queued while disconnected
+                        self._send_wakeup.set()
+                        self._send_task = asyncio.create_task(
+                            self._send_loop(), name=f"ws-send[{self.url}]"
+                        )
+                    await self._recv_loop(ws)
 
             except (websockets.ConnectionClosed, OSError) as e:
                 await self._on_error(error=e)
 
+                self._backoff = min(
+                    self._MAX_RECONNECT_DELAY,
+                    random.uniform(self._reconnect_delay, self._backoff * 3),
+                )
                 logger.error(
-                    f"[{self.url}] Connection lost: {e}. "
-                    f"Reconnecting in {self._reconnect_delay}s..."
+                    "[%s] Connection lost: %s. Reconnecting in %.1fs...",
+                    self.url,
+                    e,
+                    self._backoff,
                 )
 
                 need_reconnect = True
 
             finally:
-                if self._start_event.is_set():
+                if self._state == _CONNECTED:
                     # send the on_close event only if
                     # was send the on_connected event
                     await self._on_close()
+                    # a stop() landing while on_close ran must not be undone
+                    if self._state == _CONNECTED:
+                        self._state = _STARTED
 
                 self._ws = None
-                self._start_event.clear()
 
                 # Stopped send loop when connection is broken
                 if self._send_task and not self._send_task.done():
                     await self._close_send_loop()
 
-            # wait reconnect_delay seconds before try to reconnect
+            # wait the backoff before try to reconnect
             # not blocking the finally block
             if need_reconnect:
-                await asyncio.sleep(self._reconnect_delay)
+                await asyncio.sleep(self._backoff)
+
+    def _set_busy_poll(self, ws: websockets.ClientConnection):
+        sock = ws.transport.get_extra_info("socket")
+        if _SO_BUSY_POLL is None or sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, self._busy_poll)
+        except OSError as e:
+            logger.warning("[%s] Failed to set SO_BUSY_POLL: %s", self.url, e)
+
+    async def _recv_loop(self, ws: websockets.ClientConnection):
+        """Loop for passing received messages to the handler.
+
+        Messages are passed as raw bytes, whatever the frame type,
+        so the handler can parse them without a UTF-8 decode first.
+        The handler may be a coroutine function or a plain function.
+        """
+        on_message = self._on_message_handler
+        recv = ws.recv
+        try:
+            while True:
+                # a plain function handler is called without the await machinery
+                result = on_message(await recv(decode=False))
+                if result is not None:
+                    await result
+        except websockets.ConnectionClosedOK:
+            return
 
     async def _send_loop(self):
-        """Loop for sending messages from queue."""
+        """Loop for sending messages from the buffer."""
+        # the loop runs per connection, so its connection is bound once
+        send = self._ws.send
+        buf = self._send_buf
+        wakeup = self._send_wakeup
         while self._ws is not None and self.is_started:
             try:
-                msg = await self._send_queue.get()
+                await wakeup.wait()
+                wakeup.clear()
 
-                if msg is None:  # signal for closing
-                    return
+                batch = 0
+                while buf:
+                    msg = buf.popleft()
+
+                    if msg is None:  # signal for closing
+                        return
+
+                    if not (self._ws and self.is_connected):
+                        # the connection is going away, the message waits
+                        # in the buffer for the next send loop
+                        buf.appendleft(msg)
+                        return
 
-                if self._ws and self.is_connected:
                     try:
-                        await self._ws.send(msg)
+                        # bytes are sent as text frames as well
+                        await send(msg, text=True)
                     except Exception as e:
-                        logger.error(f"[{self.url}] Failed to send message: {e}")
+                        logger.error("[%s] Failed to send message: %s", self.url, e)
+
+                    # a long burst doesn't hold back the receive loop
+                    batch += 1
+                    if batch == self._MAX_SEND_BATCH:
+                        batch = 0
+                        await asyncio.sleep(0)
 
             except asyncio.CancelledError:
                 break
@@ -136,25 +290,35 @@ class AsyncWSListener:
     async def _close_send_loop(self):
         """Correctly stops send_loop."""
         if self._send_task and not self._send_task.done():
-            await self._send_queue.put(None)
+            self._send_buf.append(None)
+            self._send_wakeup.set()
             try:
                 await asyncio.wait_for(self._send_task, timeout=5.0)
             except TimeoutError:
                 self._send_task.cancel()
-                await asyncio.gather(self._send_task, return_exceptions=True)
+                with suppress(asyncio.CancelledError, Exception):
+                    await self._send_task
+            # the loop may have stopped before reaching the close signal
+            with suppress(ValueError):
+                self._send_buf.remove(None)
+
+    async def _wait_connected(self):
+        async with self._state_changed:
+            await self._state_changed.wait_for(lambda: self._state == _CONNECTED)
 
     async def start(self):
         """Starts the listener for ws connection."""
         if not self.is_started:
-            self._start_event.clear()
-            self._stop_event.clear()
+            self._state = _STARTED
 
-            self._task = asyncio.create_task(self._listen())
+            self._task = asyncio.create_task(
+                self._listen(), name=f"ws-listen[{self.url}]"
+            )
 
             # wait for successful connection
             try:
                 await asyncio.wait_for(
-                    self._start_event.wait(),
+                    self._wait_connected(),
                     # wait 3 reconnections
                     # 1 reconnect_delay for create connection
                     # + 1 reconnect_dellay waiting before try reconnection
@@ -170,8 +334,7 @@ class AsyncWSListener:
     async def stop(self):
         """Stops the listener for ws connection."""
         if self.is_started:
-            self._stop_event.set()
-            self._start_event.clear()
+            self._state = _STOPPED
 
             # closes ws connection
             if self._ws:
@@ -181,9 +344,38 @@ class AsyncWSListener:
             # stops the main task
             if self._task and not self._task.done():
                 self._task.cancel()
-                await asyncio.gather(self._task, return_exceptions=True)
-
-    async def send(self, msg: str):
-        """Adds a message to the queue for sending."""
-        if msg is not None and self.is_started:
-            await self._send_queue.put(msg)
+                with suppress(asyncio.CancelledError, Exception):
+                    await self._task
+
+    async def send(self, msg: str | bytes):
+        """Sends a message over the open connection.
+
+        Bytes must be UTF-8 encoded text, they are sent as a text frame.
+        Without an open connection the message is dropped and a warning
+        is logged: only subscriptions are replayed on reconnect, by their
+        owners. In buffered mode the message is queued for the send task
+        instead and goes out once the connection is back. A stopped
+        listener drops messages with a warning in both modes.
+        """
+        if msg is None:
+            return
+        if not self.is_started:
+            logger.warning("[%s] Listener is stopped, message dropped", self.url)
+            return
+
+        if self._buffered:
+            self._send_buf.append(msg)
+            self._send_wakeup.set()
+            return
+
+        async with self._send_lock:
+            # the connection is set before on_connected is called,
+            # so its handlers can already send
+            ws = self._ws
+            if ws is None:
+                logger.warning("[%s] Not connected, message dropped", self.url)
+                return
+            try:
+                await ws.send(msg, text=True)
+            except Exception as e:
+                logger.error("[%s] Failed to send message: %s", self.url, e)
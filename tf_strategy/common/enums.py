@@ -18,6 +18,29 @@ class TimeInterval(StrEnum):
     _2d = "3d"
     _1M = "1M"
 
+    @property
+    def milliseconds(self) -> int | None:
+        """Interval length in ms, None for calendar-based intervals (e.g. 1M)."""
+        return _INTERVAL_MS.get(self)
+
+
+_INTERVAL_MS: dict[TimeInterval, int] = {
+    TimeInterval._1s: 1_000,
+    TimeInterval._1m: 60_000,
+    TimeInterval._3m: 3 * 60_000,
+    TimeInterval._5m: 5 * 60_000,
+    TimeInterval._15m: 15 * 60_000,
+    TimeInterval._30m: 30 * 60_000,
+    TimeInterval._1h: 3_600_000,
+    TimeInterval._2h: 2 * 3_600_000,
+    TimeInterval._4h: 4 * 3_600_000,
+    TimeInterval._6h: 6 * 3_600_000,
+    TimeInterval._8h: 8 * 3_600_000,
+    TimeInterval._12h: 12 * 3_600_000,
+    TimeInterval._1d: 86_400_000,
+    TimeInterval._2d: 3 * 86_400_000,
+}
+
 
 class Side(StrEnum):
     Buy = "BUY"
@@ -34,11 +57,10 @@ class Type(StrEnum):
 
     @property
     def requires_price(self) -> bool:
-        return self in {
-            Type.Limit,
-            Type.StopLossLimit,
-            Type.TakeProfitLimit,
-        }
+        return self in _REQUIRES_PRICE
+
+
+_REQUIRES_PRICE = frozenset({Type.Limit, Type.StopLossLimit, Type.TakeProfitLimit})
 
 
 class TimeInForce(StrEnum):
@@ -1,13 +1,14 @@
+import sys
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, get_args
+from functools import lru_cache
+from typing import Any, ClassVar, get_args
 
+import numpy as np
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
-    PrivateAttr,
-    computed_field,
-    field_validator,
     model_validator,
 )
 
@@ -24,23 +25,50 @@ class ConnectorConfig(BaseModel):
     private_key: Any = None
 
 
-class Symbol(BaseModel):
+@dataclass(slots=True)
+class Symbol:
+    """Trading pair.
+
+    Plain slotted dataclass instead of a pydantic model: `symbol` and
+    `r_symbol` are read on every request, so they are formatted once
+    on construction and on `set_format` instead of on every access.
+    """
+
     first: str
     second: str
 
-    _fmt = PrivateAttr(default="{}/{}")
+    _default_fmt: ClassVar[str] = "{}/{}"
+
+    _symbol: str = field(init=False, repr=False, compare=False)
+    _r_symbol: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # normalize symbol parts to uppercase
+        self.first = self.first.upper()
+        self.second = self.second.upper()
+        self._apply_format(self._default_fmt)
+
+    @classmethod
+    def of(cls, first: str, second: str) -> Symbol:
+        """Create a symbol from trusted, already uppercase parts.
+
+        Skips normalization, intended for internal hot paths only.
+        """
+        obj = object.__new__(cls)
+        obj.first = first
+        obj.second = second
+        obj._apply_format(cls._default_fmt)
+        return obj
 
-    @computed_field
     @property
     def symbol(self) -> str:
         """Create a symbol from parts."""
-        return self._fmt.format(self.first, self.second)
+        return self._symbol
 
-    @computed_field
     @property
     def r_symbol(self) -> str:
         """Create a reverse symbol from parts."""
-        return self._fmt.format(self.second, self.first)
+        return self._r_symbol
 
     def set_format(self, fmt: str):
         """Sets formatting for a symbol.
@@ -51,13 +79,22 @@ class Symbol(BaseModel):
         if fmt.count("{}") != 2:
             raise ValueError("Format must contain exactly two '{}' placeholders")
 
-        self._fmt = fmt
+        self._apply_format(fmt)
 
-    @field_validator("first", "second", mode="before")
-    @classmethod
-    def to_upper(cls, v: str) -> str:
-        """Normalize symbol parts to uppercase."""
-        return v.upper()
+    def _apply_format(self, fmt: str):
+        # interned, so equal symbols used as dict keys compare by identity
+        self._symbol = sys.intern(fmt.format(self.first, self.second))
+        self._r_symbol = sys.intern(fmt.format(self.second, self.first))
+
+
+@lru_cache(maxsize=4096)
+def make_symbol(first: str, second: str, cls: type[Symbol] = Symbol) -> Symbol:
+    """Return a shared `cls` instance for the pair.
+
+    The same object is returned for equal arguments, so callers
+    must not change it with `set_format`.
+    """
+    return cls(first=first, second=second)
 
 
 class Kline(BaseModel):
@@ -76,6 +113,53 @@ class Kline(BaseModel):
     model_config = ConfigDict(validate_by_name=True)
 
 
+@dataclass(slots=True)
+class KlineBatch:
+    """Klines stored column-wise, one array per `Kline` field.
+
+    Prices and volumes are `float64`, or exact `int64` numbers
+    of 10**-scale units if `scale` is set.
+    """
+
+    open_time: np.ndarray
+    open_price: np.ndarray
+    high_price: np.ndarray
+    low_price: np.ndarray
+    close_price: np.ndarray
+    volume: np.ndarray
+    close_time: np.ndarray
+    quote_asset_volume: np.ndarray
+    number_of_trades: np.ndarray
+    taker_buy_base_volume: np.ndarray
+    taker_buy_quote_volume: np.ndarray
+    scale: int | None = None
+
+    _int_fields: ClassVar[tuple[str, ...]] = (
+        "open_time",
+        "close_time",
+        "number_of_trades",
+    )
+    _decimal_fields: ClassVar[tuple[str, ...]] = tuple(
+        name for name, info in Kline.model_fields.items() if info.annotation is Decimal
+    )
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    def __getitem__(self, idx: int) -> Kline:
+        """Materialize a single `Kline` from the columns."""
+        values = {name: getattr(self, name)[idx].item() for name in self._int_fields}
+        scale = self.scale
+        for name in self._decimal_fields:
+            value = getattr(self, name)[idx].item()
+            if scale is None:
+                # shortest repr round-trips the originally parsed string
+                values[name] = Decimal(repr(value))
+            else:
+                values[name] = Decimal(value).scaleb(-scale)
+        return Kline.model_construct(**values)
+
+
 class BalanceForAsset(BaseModel):
     asset: str
     free: Decimal
@@ -97,21 +181,28 @@ class Order(BaseModel):
     new_client_order_id: str | None = None
     stop_price: Decimal | None = None
 
-    @model_validator(mode="after")
-    def check_decimals_value(cls, values: Order):
-        for field_name, field_info in Order.model_fields.items():
-            if isinstance(field_info.annotation, Decimal) or Decimal in get_args(
-                field_info.annotation
-            ):
-                value = getattr(values, field_name)
+    # validated once on construction, never changed afterwards
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-                if value is not None and value < Decimal("0"):
-                    raise ValueError(f"Field '{field_name}' must be greater than zero")
+    @classmethod
+    def trusted(cls, **values) -> Order:
+        """Create an order from already valid values without validation.
 
-        return values
+        Intended for internal callers only, e.g. orders derived
+        from a validated one.
+        """
+        return cls.model_construct(**values)
 
     @model_validator(mode="after")
-    def check_quantity(cls, values: Order):
+    def check_order(cls, values: Order):
+        # a single validator: every one is a separate call from pydantic-core
+        for field_name in _ORDER_DECIMAL_FIELDS:
+            value = getattr(values, field_name)
+
+            # comparing with an int is exact and needs no Decimal per call
+            if value is not None and value < 0:
+                raise ValueError(f"Field '{field_name}' must be greater than zero")
+
         q = values.quantity
         qq = values.quote_order_qty
 
@@ -123,17 +214,9 @@ class Order(BaseModel):
         if q and qq:
             raise ValueError("Quantity and quote_order_qty cannot be used together")
 
-        return values
-
-    @model_validator(mode="after")
-    def check_price(cls, values: Order):
         if values.type.requires_price and values.price is None:
             raise ValueError("A non-market order must contain a price")
 
-        return values
-
-    @model_validator(mode="after")
-    def check_time_in_force(cls, values: Order):
         if values.type != Type.Market and not values.time_in_force:
             raise ValueError("A non-market order must contain time_in_force")
 
@@ -143,6 +226,14 @@ class Order(BaseModel):
         return values
 
 
+# Decimal fields of an order, collected once instead of on every validation
+_ORDER_DECIMAL_FIELDS: tuple[str, ...] = tuple(
+    name
+    for name, info in Order.model_fields.items()
+    if info.annotation is Decimal or Decimal in get_args(info.annotation)
+)
+
+
 class OrderOCO(BaseModel):
     symbol: Symbol
     side: Side
@@ -4,6 +4,8 @@ from enum import IntEnum
 import numpy as np
 import pandas as pd
 
+from .candles import CandleWindow
+
 
 class TradeSignal(IntEnum):
     OpenPosition = 1
@@ -28,8 +30,18 @@ class BaseStrategy(ABC):
     def signals(self) -> list:
         return self._signals
 
+    @property
+    def required_history(self) -> int | None:
+        """
+        Number of the latest candles `update_incremental` reads.
+
+        Live data is kept in a window of this size, None keeps the whole
+        history the strategy was initialized with.
+        """
+        return None
+
     @abstractmethod
-    def update_batch(self, data: pd.DataFrame):
+    def update_batch(self, data: pd.DataFrame | CandleWindow):
         """
         Update trading signals for the entire dataset (batch mode).
 
@@ -38,12 +50,12 @@ class BaseStrategy(ABC):
         or when recalculating indicators over historical data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing OHLCV price data.
-                Expected columns: ['open', 'high', 'low', 'close', 'volume'].
+            data (pd.DataFrame | CandleWindow): OHLCV price data, columns
+                are read by name: ['open', 'high', 'low', 'close', 'volume'].
         """
 
     @abstractmethod
-    def update_incremental(self, data: pd.DataFrame):
+    def update_incremental(self, data: pd.DataFrame | CandleWindow):
         """
         Update only the most recent signal and append it to existing signals (realtime/live mode).
 
@@ -51,8 +63,8 @@ class BaseStrategy(ABC):
         the latest price or bar is available.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the latest OHLCV bar(s).
-                Expected columns: ['open', 'high', 'low', 'close', 'volume'].
+            data (pd.DataFrame | CandleWindow): The latest OHLCV bar(s),
+                columns are read by name: ['open', 'high', 'low', 'close', 'volume'].
         """
 
     def get_last_signal(self) -> TradeSignal:
@@ -0,0 +1,103 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from tf_strategy.common.schemas import Kline
+
+
+class CandleWindow:
+    """Fixed-size window of the latest candles, oldest first.
+
+    Columns are read by name like a DataFrame, e.g. `window["close"]`,
+    as float64 arrays. Every candle is stored twice, at `i` and
+    `i + size`, so the window is always one contiguous slice: appending
+    is a few scalar stores and reading never copies.
+    """
+
+    COLUMNS = ("open", "close", "high", "low", "volume")
+    # `Kline` field of each column
+    _FIELDS = ("open_price", "close_price", "high_price", "low_price", "volume")
+
+    __slots__ = ("_size", "_columns", "_close_time", "_head", "_count")
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("Window size must be positive")
+        self._size = size
+        self._columns = dict(
+            zip(
+                self.COLUMNS,
+                np.full((len(self.COLUMNS), 2 * size), np.nan),
+                strict=True,
+            )
+        )
+        self._close_time = np.zeros(2 * size, dtype=np.int64)
+        self._head = 0
+        self._count = 0
+
+    @classmethod
+    def from_klines(cls, klines: Iterable[Kline], size: int) -> CandleWindow:
+        """Window of the last `size` of `klines`."""
+        window = cls(size)
+        # only the tail fits, read it into one (n, 5) block in a single pass
+        # and fill both halves of every column at once
+        tail = list(klines)[-size:]
+        n = len(tail)
+        values = np.array(
+            [[getattr(kline, name) for name in cls._FIELDS] for kline in tail],
+            dtype=np.float64,
+        ).reshape(n, len(cls._FIELDS))
+        for column, array in zip(cls.COLUMNS, values.T, strict=True):
+            target = window._columns[column]
+            target[:n] = target[size : size + n] = array
+        close_time = np.array([kline.close_time for kline in tail], dtype=np.int64)
+        window._close_time[:n] = window._close_time[size : size + n] = close_time
+
+        window._head = n % size
+        window._count = n
+        return window
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Read-only view of a column, oldest first."""
+        return self._view(self._columns[column])
+
+    @property
+    def close_time(self) -> np.ndarray:
+        """Read-only view of the close times, POSIX timestamps in ms."""
+        return self._view(self._close_time)
+
+    @property
+    def last_close_time(self) -> int | None:
+        """Close time of the latest candle, None for an empty window."""
+        if not self._count:
+            return None
+        # the mirror slot of the latest candle is valid for any head
+        return int(self._close_time[self._head - 1 + self._size])
+
+    def append(self, kline: Kline):
+        """Add a closed candle, the oldest one leaves a full window."""
+        head = self._head
+        mirror = head + self._size
+        columns = self._columns
+        for column, value in (
+            ("open", kline.open_price),
+            ("close", kline.close_price),
+            ("high", kline.high_price),
+            ("low", kline.low_price),
+            ("volume", kline.volume),
+        ):
+            columns[column][head] = columns[column][mirror] = value
+        self._close_time[head] = self._close_time[mirror] = kline.close_time
+
+        self._head = (head + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def _view(self, array: np.ndarray) -> np.ndarray:
+        stop = self._head + self._size
+        view = array[stop - self._count : stop]
+        view.flags.writeable = False
+        return view
@@ -1,9 +1,9 @@
 from typing import NamedTuple
 
 import numpy as np
-from scipy.signal import lfilter
+from numba import njit, types
 
-__all__ = ["adx", "adx_update", "AdxIncremental", "AdxBatch"]
+__all__ = ["adx", "adx_numpy", "adx_update", "AdxIncremental", "AdxBatch"]
 
 
 class AdxIncremental(NamedTuple):
@@ -20,6 +20,7 @@ class AdxBatch(NamedTuple):
     mdms: np.ndarray
 
 
+@njit(cache=True, fastmath={"contract"})
 def __wilder_smoothing(data: np.ndarray, period: int):
     """
     Apply Wilder's smoothing to data.
@@ -36,22 +37,27 @@ def __wilder_smoothing(data: np.ndarray, period: int):
     np.ndarray
         Smoothed values. First period-1 values are NaN.
     """
-    coef = (period - 1) / period
-    result = np.full_like(data, np.nan)
-
-    result[period - 1 :], _ = lfilter(
-        b=[1.0 / period],
-        a=[1.0, -coef],
-        x=data[period - 1 :],
-        zi=[data[:period].mean() * coef],
-    )
+    rperiod = 1.0 / period
+    coef = (period - 1) * rperiod
+    result = np.full(data.shape[0], np.nan)
+    if period <= 0 or period > data.shape[0]:
+        return result
+
+    # the recurrence starts from the mean of the first `period` values
+    s = data[:period].mean() * coef + data[period - 1] * rperiod
+    result[period - 1] = s
+    for i in range(period, data.shape[0]):
+        s = s * coef + data[i] * rperiod
+        result[i] = s
 
     return result
 
 
-def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> AdxBatch:
+def adx_numpy(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> AdxBatch:
     """
-    Calculate Average Directional Index (ADX).
+    Calculate Average Directional Index (ADX) step by step with NumPy arrays.
 
     ADX measures trend strength (not direction) from 0 to 100:
     - 0-25: Weak or no trend
@@ -75,26 +81,29 @@ def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> Ad
     np.ndarray
         ADX values. First 2*period-1 values are 0 or unreliable.
     """
-    # True Range
-    tr = np.zeros_like(high)
+    # True Range, ufuncs write in place instead of allocating temporaries
+    tr = np.empty_like(high)
     tr[0] = high[0] - low[0]
-    tr[1:] = np.maximum(
-        high[1:] - low[1:],
-        np.maximum(
-            np.abs(high[1:] - close[:-1]),
-            np.abs(low[1:] - close[:-1]),
-        ),
-    )
+    np.subtract(high[1:], low[1:], out=tr[1:])
+    gap = np.subtract(high[1:], close[:-1])
+    np.abs(gap, out=gap)
+    np.maximum(tr[1:], gap, out=tr[1:])
+    np.subtract(low[1:], close[:-1], out=gap)
+    np.abs(gap, out=gap)
+    np.maximum(tr[1:], gap, out=tr[1:])
 
     # Directional movements
     upmove = np.zeros_like(high)
     downmove = np.zeros_like(high)
 
-    upmove[1:] = high[1:] - high[:-1]
-    downmove[1:] = low[:-1] - low[1:]
+    np.subtract(high[1:], high[:-1], out=upmove[1:])
+    np.subtract(low[:-1], low[1:], out=downmove[1:])
 
-    pdm = np.where((upmove > downmove) & (upmove > 0), upmove, 0)
-    mdm = np.where((downmove > upmove) & (downmove > 0), downmove, 0)
+    # the winning move counts only if positive: clip at 0 in place
+    pdm = np.where(upmove > downmove, upmove, 0.0)
+    np.maximum(pdm, 0.0, out=pdm)
+    mdm = np.where(downmove > upmove, downmove, 0.0)
+    np.maximum(mdm, 0.0, out=mdm)
 
     # Update smoothed TR
     trs = __wilder_smoothing(tr, period)
@@ -126,6 +135,165 @@ def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> Ad
     return AdxBatch(adx=adx_values, trs=trs, pdms=pdms, mdms=mdms)
 
 
+# NaN is a regular output value here, so only FMA contraction is enabled
+# instead of the full fastmath set, which assumes there are no NaNs.
+# Compiled eagerly for float64 and float32 results, `adx` always passes
+# contiguous float64 prices, possibly read-only ones from pandas.
+@njit(
+    [
+        types.void(
+            *[types.Array(types.float64, 1, "C", readonly=True)] * 3,
+            types.int64,
+            *[dtype[:]] * 4,
+        )
+        for dtype in (types.float64, types.float32)
+    ],
+    cache=True,
+    fastmath={"contract"},
+)
+def _adx_kernel(high, low, close, period, adx_values, trs, pdms, mdms):
+    """Fused single pass of `adx_numpy`: TR, DM, smoothing, DI, DX and ADX.
+
+    Every output element is written, so the outputs may be uninitialized.
+    """
+    n = high.shape[0]
+    if period <= 0 or period > n:
+        adx_values[:] = np.nan
+        trs[:] = np.nan
+        pdms[:] = np.nan
+        mdms[:] = np.nan
+        return
+
+    rperiod = 1.0 / period
+    coef = (period - 1) * rperiod
+
+    # Wilder's smoothing starts from the mean of the first `period` values
+    s_tr = 0.0
+    s_pdm = 0.0
+    s_mdm = 0.0
+    s_adx = 0.0
+
+    for i in range(n):
+        # True Range and directional movements
+        if i == 0:
+            tr = high[0] - low[0]
+            pdm = 0.0
+            mdm = 0.0
+        else:
+            tr = max(
+                high[i] - low[i],
+                abs(high[i] - close[i - 1]),
+                abs(low[i] - close[i - 1]),
+            )
+            upmove = high[i] - high[i - 1]
+            downmove = low[i - 1] - low[i]
+            pdm = upmove if upmove > downmove and upmove > 0 else 0.0
+            mdm = downmove if downmove > upmove and downmove > 0 else 0.0
+
+        if i < period - 1:
+            s_tr += tr
+            s_pdm += pdm
+            s_mdm += mdm
+            trs[i] = np.nan
+            pdms[i] = np.nan
+            mdms[i] = np.nan
+            adx_values[i] = np.nan
+            continue
+
+        if i == period - 1:
+            s_tr = (s_tr + tr) * rperiod * coef + tr * rperiod
+            s_pdm = (s_pdm + pdm) * rperiod * coef + pdm * rperiod
+            s_mdm = (s_mdm + mdm) * rperiod * coef + mdm * rperiod
+        else:
+            s_tr = s_tr * coef + tr * rperiod
+            s_pdm = s_pdm * coef + pdm * rperiod
+            s_mdm = s_mdm * coef + mdm * rperiod
+
+        trs[i] = s_tr
+        pdms[i] = s_pdm
+        mdms[i] = s_mdm
+
+        # DI and DX
+        dx = np.nan
+        if s_tr != 0:
+            pdi = 100 * s_pdm / s_tr
+            mdi = 100 * s_mdm / s_tr
+            di_sum = pdi + mdi
+            if di_sum != 0:
+                dx = 100 * abs(pdi - mdi) / di_sum
+
+        # ADX is Wilder's smoothing of DX, published from 2*period-1 on
+        if i < 2 * period - 2:
+            s_adx += dx
+            adx_values[i] = np.nan
+        elif i == 2 * period - 2:
+            s_adx = (s_adx + dx) * rperiod * coef + dx * rperiod
+            adx_values[i] = np.nan
+        else:
+            s_adx = s_adx * coef + dx * rperiod
+            adx_values[i] = s_adx
+
+
+def adx(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    out: AdxBatch | None = None,
+    dtype: np.dtype = np.float64,
+) -> AdxBatch:
+    """
+    Calculate Average Directional Index (ADX) in a single JIT-compiled pass.
+
+    Same values as `adx_numpy` without the intermediate arrays
+    and separate smoothing passes. The computation itself is always
+    done in float64, `dtype` only sets the storage of the results.
+
+    Parameters
+    ----------
+    high : np.ndarray
+        High prices
+    low : np.ndarray
+        Low prices
+    close : np.ndarray
+        Close prices
+    period : int
+        ADX calculation period
+    out : AdxBatch, optional
+        Caller-owned arrays of the prices length to write the results
+        into, e.g. reused between calls. Allocated if not given.
+    dtype : np.dtype, default np.float64
+        Dtype of the allocated results, np.float32 halves their size.
+
+    Returns
+    -------
+    AdxBatch
+        ADX and smoothed TR, +DM, -DM values, `out` if given. ADX is NaN
+        for the first 2*period-1 values.
+    """
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    if out is None:
+        # a single allocation, every row is a contiguous result array
+        out = AdxBatch(*np.empty((4, high.shape[0]), dtype=dtype))
+
+    _adx_kernel(
+        high,
+        np.ascontiguousarray(low, dtype=np.float64),
+        np.ascontiguousarray(close, dtype=np.float64),
+        period,
+        *out,
+    )
+    return out
+
+
+# compiled eagerly for the one signature it is called with, so no call
+# pays for type dispatch resolution or a first-call compilation
+@njit(
+    "UniTuple(float64, 4)("
+    "float64, float64, float64, float64, float64,"
+    "float64, float64, float64, float64, int64)",
+    cache=True,
+)
 def adx_update(
     high: float,
     prev_high: float,
@@ -137,7 +305,7 @@ def adx_update(
     last_pdms: float,
     last_mdms: float,
     period: int,
-) -> AdxIncremental:
+) -> tuple[float, float, float, float]:
     """
     Update ADX incrementally with new price bar.
 
@@ -166,8 +334,9 @@ def adx_update(
 
     Returns
     -------
-    ADXIncremental
-        NamedTuple with updated values: adx, trs, pdms, mdms
+    tuple[float, float, float, float]
+        Updated values in the `AdxIncremental` order: adx, trs, pdms, mdms.
+        A plain tuple, wrap it with `AdxIncremental._make` if needed.
     """
     # True Range
     tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
@@ -184,8 +353,8 @@ def adx_update(
     upmove = high - prev_high
     downmove = prev_low - low
 
-    pdm = upmove if (upmove > downmove and upmove > 0) else 0
-    mdm = downmove if (downmove > upmove and downmove > 0) else 0
+    pdm = upmove if (upmove > downmove and upmove > 0) else 0.0
+    mdm = downmove if (downmove > upmove and downmove > 0) else 0.0
 
     # Update smoothed DM
     pdms = last_pdms * coef + pdm * rperiod
@@ -193,15 +362,15 @@ def adx_update(
 
     # Calculate DI
     if trs == 0:
-        return AdxIncremental(adx=np.nan, trs=trs, pdms=pdms, mdms=mdms)
+        return np.nan, trs, pdms, mdms
 
     pdi = 100 * pdms / trs
     mdi = 100 * mdms / trs
 
     # Calculate DX
     di_sum = pdi + mdi
-    dx = 0 if di_sum == 0 else 100 * abs(pdi - mdi) / di_sum
+    dx = 0.0 if di_sum == 0 else 100 * abs(pdi - mdi) / di_sum
 
     adx = last_adx * coef + dx * rperiod
 
-    return AdxIncremental(adx=adx, trs=trs, pdms=pdms, mdms=mdms)
+    return adx, trs, pdms, mdms
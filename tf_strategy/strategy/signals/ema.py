@@ -1,20 +1,26 @@
 import numpy as np
-from scipy.signal import lfilter
+from numba import njit, types
 
 
-def ema_scipy(price: np.ndarray, period: int) -> np.ndarray:
+def ema_scipy(
+    price: np.ndarray, period: int, dtype: np.dtype = np.float64
+) -> np.ndarray:
     """
     Compute Exponential Moving Average (EMA) using SciPy IIR filter.
 
     Args:
         price (np.ndarray): Array of price values.
         period (int): EMA period.
+        dtype (np.dtype): Dtype of the result, the filter runs in float64.
 
     Returns:
         np.ndarray: Array of EMA values. The first `period-1` elements are NaN.
     """
+    # SciPy is only needed by this reference implementation
+    from scipy.signal import lfilter
+
     price = np.asarray(price, dtype=float)
-    out = np.full(price.shape, np.nan)
+    out = np.full(price.shape, np.nan, dtype=dtype)
 
     if period <= 0 or period > price.size:
         return out
@@ -34,6 +40,115 @@ def ema_scipy(price: np.ndarray, period: int) -> np.ndarray:
     return out
 
 
+# compiled eagerly, so the first batch does not pay for the compilation.
+# A read-only signature also takes writable arrays, and pandas returns
+# read-only ones under copy-on-write. Only FMA contraction is allowed, as
+# in `_adx_kernel`: a NaN price has to propagate through the recurrence.
+@njit(
+    types.float64[::1](types.Array(types.float64, 1, "A", readonly=True), types.int64),
+    cache=True,
+    fastmath={"contract"},
+)
+def ema_numba(price: np.ndarray, period: int) -> np.ndarray:
+    """
+    Compute Exponential Moving Average (EMA) in a single pass.
+
+    JIT-compiled 1-pole recurrence, same values as `ema_scipy`.
+
+    Args:
+        price (np.ndarray): float64 array of price values.
+        period (int): EMA period.
+
+    Returns:
+        np.ndarray: Array of EMA values. The first `period-1` elements are NaN.
+    """
+    n = price.shape[0]
+    out = np.full(n, np.nan)
+    if period <= 0 or period > n:
+        return out
+
+    alpha = 2.0 / (period + 1.0)
+
+    # seeded with the SMA of the first `period` prices
+    seed = 0.0
+    for i in range(period):
+        seed += price[i]
+    ema = seed / period
+    ema += alpha * (price[period - 1] - ema)
+    out[period - 1] = ema
+
+    for i in range(period, n):
+        ema += alpha * (price[i] - ema)
+        out[i] = ema
+    return out
+
+
+@njit(
+    types.UniTuple(types.float64[::1], 2)(
+        types.Array(types.float64, 1, "A", readonly=True), types.int64, types.int64
+    ),
+    cache=True,
+    fastmath={"contract"},
+)
+def ema_numba_dual(
+    price: np.ndarray, fast_period: int, slow_period: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute a fast and a slow EMA of the same prices in one pass.
+
+    Same values as two `ema_numba` calls, reading the prices once.
+
+    Args:
+        price (np.ndarray): float64 array of price values.
+        fast_period (int): Period of the first EMA.
+        slow_period (int): Period of the second EMA.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The fast and the slow EMA.
+    """
+    n = price.shape[0]
+    if not (0 < fast_period <= n and 0 < slow_period <= n):
+        return ema_numba(price, fast_period), ema_numba(price, slow_period)
+
+    fast_out = np.full(n, np.nan)
+    slow_out = np.full(n, np.nan)
+    fast_alpha = 2.0 / (fast_period + 1.0)
+    slow_alpha = 2.0 / (slow_period + 1.0)
+
+    # both seeded with the SMA of their first `period` prices
+    fast = 0.0
+    for i in range(fast_period):
+        fast += price[i]
+    fast /= fast_period
+    fast += fast_alpha * (price[fast_period - 1] - fast)
+    fast_out[fast_period - 1] = fast
+
+    slow = 0.0
+    for i in range(slow_period):
+        slow += price[i]
+    slow /= slow_period
+    slow += slow_alpha * (price[slow_period - 1] - slow)
+    slow_out[slow_period - 1] = slow
+
+    # the shorter EMA runs alone until the longer one is seeded,
+    # then both recurrences share every price read
+    start = max(fast_period, slow_period)
+    for i in range(fast_period, start):
+        fast += fast_alpha * (price[i] - fast)
+        fast_out[i] = fast
+    for i in range(slow_period, start):
+        slow += slow_alpha * (price[i] - slow)
+        slow_out[i] = slow
+
+    for i in range(start, n):
+        p = price[i]
+        fast += fast_alpha * (p - fast)
+        slow += slow_alpha * (p - slow)
+        fast_out[i] = fast
+        slow_out[i] = slow
+    return fast_out, slow_out
+
+
 def ema_update(new_price: float, last_ema_value: float, alpha: float) -> float:
     """
     Incrementally update EMA with a new price (realtime).
@@ -2,7 +2,7 @@ from typing import NamedTuple
 
 import numpy as np
 
-from .sma import sma_numpy, sma_update
+from .sma import _sma_into, sma_update
 
 
 class RsiIncremental(NamedTuple):
@@ -16,13 +16,14 @@ class RsiBatch(NamedTuple):
     avg_gain: np.ndarray
     avg_loss: np.ndarray
 
-    def update(self, incremental: RsiIncremental):
-        self.rsi = np.concatenate(self.rsi, [incremental.rsi])
-        self.avg_gain = np.concatenate(self.avg_gain, [incremental.gain])
-        self.avg_loss = np.concatenate(self.avg_loss, [incremental.loss])
+    def update(self, incremental: RsiIncremental | tuple):
+        rsi, gain, loss = incremental
+        self.rsi = np.concatenate(self.rsi, [rsi])
+        self.avg_gain = np.concatenate(self.avg_gain, [gain])
+        self.avg_loss = np.concatenate(self.avg_loss, [loss])
 
 
-def rsi_sma_numpy(close, period) -> RsiBatch:
+def rsi_sma_numpy(close, period, dtype=np.float64) -> RsiBatch:
     """
     Compute RSI using SMA over gains and losses (vectorized, batch mode).
 
@@ -32,6 +33,8 @@ def rsi_sma_numpy(close, period) -> RsiBatch:
         Array of closing prices.
     period : int
         RSI lookback period (SMA window).
+    dtype : np.dtype, default np.float64
+        Dtype of the results, np.float32 halves their size.
 
     Returns
     -------
@@ -45,21 +48,34 @@ def rsi_sma_numpy(close, period) -> RsiBatch:
     avg_loss : np.ndarray:
         Average losses (SMA), same length as `close`. The first element is NaN.
     """
-    delta = np.diff(close)
-    gains = np.where(delta > 0, delta, 0.0)
-    losses = np.where(delta < 0, -delta, 0.0)
-
-    avg_gain = sma_numpy(gains, period)
-    avg_loss = sma_numpy(losses, period)
-
+    close = np.asarray(close, dtype=np.float64)
+
+    # a single allocation for all results, the first (undefined) column
+    # is set directly instead of concatenated in front of every array
+    buf = np.empty((3, close.shape[0]), dtype=dtype)
+    buf[:, :1] = np.nan
+    rsi, avg_gain, avg_loss = buf
+
+    # one scratch allocation for the price changes and gains, the losses
+    # overwrite the changes; fmax treats NaN as missing, so a NaN change
+    # is neither gain nor loss
+    delta, gains = np.empty((2, max(close.shape[0] - 1, 0)))
+    np.subtract(close[1:], close[:-1], out=delta)
+    np.fmax(delta, 0.0, out=gains)
+    losses = np.fmax(np.negative(delta, out=delta), 0.0, out=delta)
+
+    _sma_into(gains, period, avg_gain[1:])
+    _sma_into(losses, period, avg_loss[1:])
+
+    # 100 - 100 / (1 + avg_gain / avg_loss), in place
+    out = rsi[1:]
     with np.errstate(divide="ignore", invalid="ignore"):
-        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        np.divide(avg_gain[1:], avg_loss[1:], out=out)
+        out += 1
+        np.divide(100, out, out=out)
+        np.subtract(100, out, out=out)
 
-    return RsiBatch(
-        rsi=np.concatenate([[np.nan], rsi]),
-        avg_gain=np.concatenate([[np.nan], avg_gain]),
-        avg_loss=np.concatenate([[np.nan], avg_loss]),
-    )
+    return RsiBatch(rsi=rsi, avg_gain=avg_gain, avg_loss=avg_loss)
 
 
 def rsi_update(
@@ -69,7 +85,7 @@ def rsi_update(
     last_loss: float,
     leave_loss: float,
     period: int,
-) -> RsiIncremental:
+) -> tuple[float, float, float]:
     """
     Incrementally update RSI with a new price change (delta) using SMA update formula.
 
@@ -90,8 +106,9 @@ def rsi_update(
 
     Returns
     -------
-    RsiIncremental
-        Container with RSI and intermediate SMA values.
+    tuple[float, float, float]
+        Updated values in the `RsiIncremental` order, a plain tuple
+        without the NamedTuple construction per tick.
     --------------------------------------------------
     rsi : float
         Updated RSI value in the range [0, 100].
@@ -123,5 +140,5 @@ def rsi_update(
             period=period,
         )
     if loss == 0:
-        return RsiIncremental(rsi=100, gain=gain, loss=loss)
-    return RsiIncremental(rsi=100 - (100 / (1 + gain / loss)), gain=gain, loss=loss)
+        return 100.0, gain, loss
+    return 100 - (100 / (1 + gain / loss)), gain, loss
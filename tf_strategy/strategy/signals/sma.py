@@ -1,25 +1,126 @@
 import numpy as np
+from numba import njit
 
 
-def sma_numpy(price: np.ndarray, period: int) -> np.ndarray:
+def sma_numpy(
+    price: np.ndarray, period: int, dtype: np.dtype = np.float64
+) -> np.ndarray:
     """
-    Compute Simple Moving Average (SMA) over a given period using NumPy convolution.
+    Compute Simple Moving Average (SMA) over a given period using a cumulative sum.
+
+    O(n) regardless of the period: every window sum is the difference
+    of two prefix sums. Non-finite prices are left out of the sums and
+    only affect the windows containing them, as with a convolution.
 
     Args:
         price (np.ndarray): Array of price values.
         period (int): The period of the SMA.
+        dtype (np.dtype): Dtype of the result, the sums stay float64.
 
     Returns:
         np.ndarray: Array of SMA values. The first `period-1` elements are NaN.
     """
-    out = np.full_like(price, np.nan, dtype=float)
-    if period > len(price):
+    out = np.full_like(price, np.nan, dtype=dtype)
+    if period <= 0 or period > len(price):
         return out
-    weights = np.ones(period) / period
-    out[period - 1 :] = np.convolve(price, weights, mode="valid")
+    price = np.asarray(price, dtype=float)
+    finite = np.isfinite(price)
+    all_finite = finite.all()
+
+    csum = np.empty(len(price) + 1)
+    csum[0] = 0.0
+    # a NaN or an infinity would poison every later prefix sum
+    np.cumsum(price if all_finite else np.where(finite, price, 0.0), out=csum[1:])
+    valid = out[period - 1 :]
+    np.subtract(csum[period:], csum[:-period], out=valid)
+    valid *= 1.0 / period
+
+    if not all_finite:
+        # the windows with a non-finite price get what a convolution gives
+        nan, pinf, ninf = (
+            _windows_with(mask, period)
+            for mask in (np.isnan(price), price == np.inf, price == -np.inf)
+        )
+        valid[pinf] = np.inf
+        valid[ninf] = -np.inf
+        valid[nan | (pinf & ninf)] = np.nan
     return out
 
 
+def _windows_with(mask: np.ndarray, period: int) -> np.ndarray:
+    """For every full window of `period` values, whether it has a True in `mask`."""
+    csum = np.concatenate(([0], np.cumsum(mask)))
+    return csum[period:] > csum[:-period]
+
+
+# NaN warm-up and gaps stay well-defined, so no `nnan`/`ninf` fastmath
+@njit(cache=True, fastmath={"contract"})
+def sma_numba(price: np.ndarray, period: int) -> np.ndarray:
+    """
+    Compute Simple Moving Average (SMA) over a given period in a single pass.
+
+    JIT-compiled `sma_numpy`, O(n) regardless of the period.
+
+    Args:
+        price (np.ndarray): Contiguous array of price values.
+        period (int): The period of the SMA.
+
+    Returns:
+        np.ndarray: Array of SMA values. The first `period-1` elements are NaN.
+    """
+    out = np.empty(price.shape[0])
+    _sma_into(price, period, out)
+    return out
+
+
+@njit(cache=True, fastmath={"contract"})
+def _sma_into(price: np.ndarray, period: int, out: np.ndarray):
+    """`sma_numba` written into the preallocated `out`, e.g. a buffer view.
+
+    Same sums as `sma_numpy`: a running sum would keep the rounding error
+    of every price that left the window, and a NaN would stick to it.
+    """
+    n = price.shape[0]
+    if period <= 0 or period > n:
+        out[:] = np.nan
+        return
+
+    inv_period = 1.0 / period
+    csum = np.empty(n + 1)
+    csum[0] = 0.0
+    # non-finite prices in the current window
+    nans = pinfs = ninfs = 0
+    for i in range(n):
+        value = price[i]
+        if np.isfinite(value):
+            csum[i + 1] = csum[i] + value
+        else:
+            csum[i + 1] = csum[i]
+            if np.isnan(value):
+                nans += 1
+            elif value > 0:
+                pinfs += 1
+            else:
+                ninfs += 1
+        if i >= period:
+            value = price[i - period]
+            if np.isnan(value):
+                nans -= 1
+            elif value == np.inf:
+                pinfs -= 1
+            elif value == -np.inf:
+                ninfs -= 1
+
+        if i < period - 1 or nans or (pinfs and ninfs):
+            out[i] = np.nan
+        elif pinfs:
+            out[i] = np.inf
+        elif ninfs:
+            out[i] = -np.inf
+        else:
+            out[i] = (csum[i + 1] - csum[i + 1 - period]) * inv_period
+
+
 def sma_update(
     new_price: float, leave_price: float, last_sma_value: float, period: int
 ) -> float:
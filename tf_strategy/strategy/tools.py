@@ -1,4 +1,5 @@
 import numpy as np
+from numba import njit, prange, types
 
 
 def crossed_above(fast, slow) -> np.ndarray:
@@ -20,8 +21,11 @@ def crossed_above(fast, slow) -> np.ndarray:
     np.ndarray
         Boolean array of same shape. First element is always False.
     """
-    out = np.zeros_like(fast, dtype=bool)
-    out[1:] = (fast[:-1] < slow[:-1]) & (fast[1:] >= slow[1:])
+    # a single signed difference instead of comparing both lines twice;
+    # NaN differences compare as False, as the lines themselves would
+    diff = np.subtract(fast, slow)
+    out = np.zeros_like(diff, dtype=bool)
+    np.logical_and(diff[:-1] < 0, diff[1:] >= 0, out=out[1:])
     return out
 
 
@@ -44,6 +48,138 @@ def crossed_below(fast, slow) -> np.ndarray:
     np.ndarray
         Boolean array of same shape. First element is always False.
     """
-    out = np.zeros_like(fast, dtype=bool)
-    out[1:] = (fast[:-1] > slow[:-1]) & (fast[1:] <= slow[1:])
+    diff = np.subtract(fast, slow)
+    out = np.zeros_like(diff, dtype=bool)
+    np.logical_and(diff[:-1] > 0, diff[1:] <= 0, out=out[1:])
+    return out
+
+
+@njit(cache=True)
+def _cross_signals_into(
+    fast, slow, rsi, adx, adx_strength, rsi_overbought, rsi_oversold, out
+):
+    """`cross_signals` written into the zeroed `out`.
+
+    Defined before `cross_signals`, whose eager compilation needs it.
+    """
+    for i in range(1, fast.shape[0]):
+        if fast[i - 1] < slow[i - 1] and fast[i] >= slow[i]:
+            if rsi[i] < rsi_oversold and adx[i] > adx_strength:
+                out[i] = 1
+        elif (
+            fast[i - 1] > slow[i - 1] and fast[i] <= slow[i] and rsi[i] > rsi_overbought
+        ):
+            out[i] = -1
+
+
+# no fastmath: NaN warm-up values must compare as False, as in NumPy.
+# Compiled eagerly for float64 lines with float64 or float32 filters,
+# read-only signatures take writable arrays as well.
+@njit(
+    [
+        types.int8[::1](
+            *[types.Array(types.float64, 1, "A", readonly=True)] * 2,
+            *[types.Array(dtype, 1, "A", readonly=True)] * 2,
+            types.float64,
+            types.float64,
+            types.float64,
+        )
+        for dtype in (types.float64, types.float32)
+    ],
+    cache=True,
+)
+def cross_signals(
+    fast: np.ndarray,
+    slow: np.ndarray,
+    rsi: np.ndarray,
+    adx: np.ndarray,
+    adx_strength: float,
+    rsi_overbought: float,
+    rsi_oversold: float,
+) -> np.ndarray:
+    """
+    Combine moving average crosses with RSI and ADX filters in a single pass.
+
+    Same result as masking `crossed_above` / `crossed_below` with the
+    filters, without the intermediate boolean arrays.
+
+    Args
+    ----------
+    fast : np.ndarray
+        Fast line (e.g., short moving average)
+    slow : np.ndarray
+        Slow line (e.g., long moving average)
+    rsi : np.ndarray
+        RSI values
+    adx : np.ndarray
+        ADX values
+    adx_strength : float
+        Minimal ADX of an entry
+    rsi_overbought : float
+        RSI an exit has to be above
+    rsi_oversold : float
+        RSI an entry has to be below
+
+    Returns
+    -------
+    np.ndarray
+        int8 array of same shape: 1 on entries, -1 on exits, 0 otherwise.
+    """
+    out = np.zeros(fast.shape[0], dtype=np.int8)
+    _cross_signals_into(
+        fast, slow, rsi, adx, adx_strength, rsi_overbought, rsi_oversold, out
+    )
+    return out
+
+
+@njit(parallel=True, cache=True)
+def cross_signals_grid(
+    ma: np.ndarray,
+    rsi: np.ndarray,
+    adx: np.ndarray,
+    fast_idx: np.ndarray,
+    slow_idx: np.ndarray,
+    rsi_idx: np.ndarray,
+    adx_idx: np.ndarray,
+    adx_strength: np.ndarray,
+    rsi_overbought: np.ndarray,
+    rsi_oversold: np.ndarray,
+) -> np.ndarray:
+    """
+    `cross_signals` of many parameter combinations, in parallel threads.
+
+    Indicator rows are computed once per distinct period and shared by
+    every combination that uses them.
+
+    Args
+    ----------
+    ma : np.ndarray
+        2D array, a moving average per row
+    rsi : np.ndarray
+        2D array, RSI values per row
+    adx : np.ndarray
+        2D array, ADX values per row
+    fast_idx, slow_idx, rsi_idx, adx_idx : np.ndarray
+        Rows of the combinations, one element per combination
+    adx_strength, rsi_overbought, rsi_oversold : np.ndarray
+        Filter levels, one element per combination
+
+    Returns
+    -------
+    np.ndarray
+        2D int8 array, the signals of a combination per row.
+    """
+    k = fast_idx.shape[0]
+    out = np.zeros((k, ma.shape[1]), dtype=np.int8)
+    for j in prange(k):
+        _cross_signals_into(
+            ma[fast_idx[j]],
+            ma[slow_idx[j]],
+            rsi[rsi_idx[j]],
+            adx[adx_idx[j]],
+            adx_strength[j],
+            rsi_overbought[j],
+            rsi_oversold[j],
+            out[j],
+        )
     return out
@@ -3,12 +3,91 @@ from typing import NamedTuple
 
 import numpy as np
 import pandas as pd
+from numba import njit, types
 
 from .base import BaseStrategy
+from .candles import CandleWindow
 from .signals.adx import AdxBatch, AdxIncremental, adx, adx_update
-from .signals.ema import ema_scipy, ema_update
-from .signals.rsi import RsiBatch, RsiIncremental, rsi_sma_numpy, rsi_update
-from .tools import crossed_above, crossed_below
+from .signals.ema import ema_numba, ema_numba_dual
+from .signals.rsi import RsiBatch, RsiIncremental, rsi_sma_numpy
+from .tools import cross_signals, cross_signals_grid
+
+
+def _tail(values: np.ndarray, size: int) -> deque:
+    """Last `size` values as a bounded deque of plain Python numbers.
+
+    Incremental updates do scalar math on these values, which is
+    several times faster on Python floats than on NumPy scalars.
+    """
+    return deque(values[-size:].tolist(), maxlen=size)
+
+
+# one compiled call per tick instead of a Python call per indicator,
+# the kernel is too small to be worth more than one dispatch
+@njit(
+    types.UniTuple(types.float64, 9)(
+        *[types.Array(types.float64, 1, "A", readonly=True)] * 3,
+        *[types.float64] * 13,
+        types.int64,
+    ),
+    cache=True,
+)
+def _tick_update(
+    high,
+    low,
+    close,
+    last_fast,
+    last_slow,
+    last_gain,
+    last_loss,
+    leave_gain,
+    leave_loss,
+    last_adx,
+    last_trs,
+    last_pdms,
+    last_mdms,
+    fast_alpha,
+    slow_alpha,
+    rsi_rperiod,
+    adx_period,
+):
+    """Fused `ema_update` of both MAs, `rsi_update` and `adx_update`.
+
+    Only the last two bars of the price columns are read. The EMA
+    smoothing factors and the RSI reciprocal period are precomputed
+    once per strategy.
+
+    Returns:
+        tuple: (fast MA, slow MA, RSI, average gain, average loss,
+        ADX, smoothed TR, smoothed +DM, smoothed -DM).
+    """
+    close_, prev_close = close[-1], close[-2]
+    fast = last_fast + fast_alpha * (close_ - last_fast)
+    slow = last_slow + slow_alpha * (close_ - last_slow)
+
+    delta = close_ - prev_close
+    gain_in = delta if delta > 0 else 0.0
+    loss_in = 0.0 if delta > 0 else -delta
+    gain = last_gain + (gain_in - leave_gain) * rsi_rperiod
+    loss = last_loss + (loss_in - leave_loss) * rsi_rperiod
+
+    rsi = 100.0
+    if loss != 0:
+        rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+
+    adx_, trs, pdms, mdms = adx_update(
+        high[-1],
+        high[-2],
+        low[-1],
+        low[-2],
+        prev_close,
+        last_adx,
+        last_trs,
+        last_pdms,
+        last_mdms,
+        adx_period,
+    )
+    return fast, slow, rsi, gain, loss, adx_, trs, pdms, mdms
 
 
 class TrendFollowing(BaseStrategy):
@@ -26,10 +105,11 @@ class TrendFollowing(BaseStrategy):
         gain: deque
         loss: deque
 
-        def update(self, incremental: RsiIncremental):
-            self.rsi.append(incremental.rsi)
-            self.gain.append(incremental.gain)
-            self.loss.append(incremental.loss)
+        def update(self, incremental: RsiIncremental | tuple):
+            rsi, gain, loss = incremental
+            self.rsi.append(rsi)
+            self.gain.append(gain)
+            self.loss.append(loss)
 
     class LimitedAdxSignal(NamedTuple):
         adx: deque
@@ -37,11 +117,13 @@ class TrendFollowing(BaseStrategy):
         pdms: deque
         mdms: deque
 
-        def update(self, incremental: AdxIncremental):
-            self.adx.append(incremental.adx)
-            self.trs.append(incremental.trs)
-            self.pdms.append(incremental.pdms)
-            self.mdms.append(incremental.mdms)
+        def update(self, incremental: AdxIncremental | tuple):
+            # `adx_update` returns a plain tuple in the AdxIncremental order
+            adx_, trs, pdms, mdms = incremental
+            self.adx.append(adx_)
+            self.trs.append(trs)
+            self.pdms.append(pdms)
+            self.mdms.append(mdms)
 
     class LimitedSignals(NamedTuple):
         signals: deque
@@ -75,16 +157,35 @@ class TrendFollowing(BaseStrategy):
         if params:
             default_params.update(params)
         super().__init__(default_params)
+        # constant arguments of `_tick_update`
+        self._tick_constants = (
+            2.0 / (default_params["fast_period"] + 1.0),
+            2.0 / (default_params["slow_period"] + 1.0),
+            1.0 / default_params["rsi_period"],
+            default_params["adx_period"],
+        )
         self._signals: TrendFollowing.LimitedSignals | None = None
+        # ADX results of `update_batch`, reused while the batches fit
+        self._adx_workspace = np.empty((4, 0))
 
     @property
     def signals(self) -> deque[int]:
         return self._signals.signals
 
-    def update_batch(self, data: pd.DataFrame):
-        high = data["high"].to_numpy(dtype=float)
-        low = data["low"].to_numpy(dtype=float)
-        close = data["close"].to_numpy(dtype=float)
+    @property
+    def required_history(self) -> int:
+        # the indicators are updated from their own state and the last two bars
+        return 2
+
+    def update_batch(self, data: pd.DataFrame | CandleWindow):
+        high = np.asarray(data["high"], dtype=float)
+        low = np.asarray(data["low"], dtype=float)
+        close = np.asarray(data["close"], dtype=float)
+
+        # only the tails of the results are kept, so the buffer is reusable
+        if self._adx_workspace.shape[1] < close.shape[0]:
+            self._adx_workspace = np.empty((4, close.shape[0]))
+        adx_out = AdxBatch(*self._adx_workspace[:, : close.shape[0]])
 
         result: TrendFollowing.FullSignals = self._generate_signals(
             high=high,
@@ -97,115 +198,71 @@ class TrendFollowing(BaseStrategy):
             rsi_period=self._params["rsi_period"],
             rsi_overbought=self._params["rsi_overbought"],
             rsi_oversold=self._params["rsi_oversold"],
+            adx_out=adx_out,
         )
 
+        fast_period = self._params["fast_period"]
+        slow_period = self._params["slow_period"]
+        rsi_period = self._params["rsi_period"]
+        adx_period = self._params["adx_period"]
+
         self._signals = TrendFollowing.LimitedSignals(
-            signals=deque(result.signals[-100:], maxlen=100),
-            fast_ma=deque(
-                result.fast_ma[-self._params["fast_period"] :],
-                maxlen=self._params["fast_period"],
-            ),
-            slow_ma=deque(
-                result.slow_ma[-self._params["slow_period"] :],
-                maxlen=self._params["slow_period"],
-            ),
+            signals=_tail(result.signals, 100),
+            fast_ma=_tail(result.fast_ma, fast_period),
+            slow_ma=_tail(result.slow_ma, slow_period),
             rsi=TrendFollowing.LimitedRsiSignal(
-                rsi=deque(
-                    result.rsi.rsi[-self._params["rsi_period"] :],
-                    maxlen=self._params["rsi_period"],
-                ),
-                gain=deque(
-                    result.rsi.avg_gain[-self._params["rsi_period"] :],
-                    maxlen=self._params["rsi_period"],
-                ),
-                loss=deque(
-                    result.rsi.avg_loss[-self._params["rsi_period"] :],
-                    maxlen=self._params["rsi_period"],
-                ),
+                rsi=_tail(result.rsi.rsi, rsi_period),
+                gain=_tail(result.rsi.avg_gain, rsi_period),
+                loss=_tail(result.rsi.avg_loss, rsi_period),
             ),
             adx=TrendFollowing.LimitedAdxSignal(
-                adx=deque(
-                    result.adx.adx[-self._params["adx_period"] :],
-                    maxlen=self._params["adx_period"],
-                ),
-                trs=deque(
-                    result.adx.trs[-self._params["adx_period"] :],
-                    maxlen=self._params["adx_period"],
-                ),
-                pdms=deque(
-                    result.adx.pdms[-self._params["adx_period"] :],
-                    maxlen=self._params["adx_period"],
-                ),
-                mdms=deque(
-                    result.adx.mdms[-self._params["adx_period"] :],
-                    maxlen=self._params["adx_period"],
-                ),
+                adx=_tail(result.adx.adx, adx_period),
+                trs=_tail(result.adx.trs, adx_period),
+                pdms=_tail(result.adx.pdms, adx_period),
+                mdms=_tail(result.adx.mdms, adx_period),
             ),
         )
 
-    def update_incremental(self, data: pd.DataFrame):
+    def update_incremental(self, data: pd.DataFrame | CandleWindow):
         if not self._signals:
-            raise
-
-        high = data["high"].to_numpy(dtype=float)
-        low = data["low"].to_numpy(dtype=float)
-        close = data["close"].to_numpy(dtype=float)
-
-        fast_period = self._params["fast_period"]
-        slow_period = self._params["slow_period"]
-        rsi_period = self._params["rsi_period"]
-
-        fast_ma = ema_update(
-            new_price=close[-1],
-            last_ema_value=self._signals.fast_ma[-1],
-            alpha=2 / (fast_period + 1),
-        )
-
-        slow_ma = ema_update(
-            new_price=close[-1],
-            last_ema_value=self._signals.slow_ma[-1],
-            alpha=2 / (slow_period + 1),
-        )
-
-        rsi = rsi_update(
-            new_delta=close[-1] - close[-2],
-            last_gain=self._signals.rsi.gain[-1],
-            leave_gain=self._signals.rsi.gain[0],
-            last_loss=self._signals.rsi.loss[-1],
-            leave_loss=self._signals.rsi.loss[0],
-            period=rsi_period,
-        )
-
-        adx_ = adx_update(
-            high=high[-1],
-            prev_high=high[-2],
-            low=low[-1],
-            prev_low=low[-2],
-            prev_close=close[-2],
-            last_adx=self._signals.adx.adx[-1],
-            last_trs=self._signals.adx.trs[-1],
-            last_pdms=self._signals.adx.pdms[-1],
-            last_mdms=self._signals.adx.mdms[-1],
-            period=self._params["adx_period"],
+            # the indicators continue from the state update_batch stored
+            raise RuntimeError("update_batch must run before update_incremental")
+
+        rsi_signal = self._signals.rsi
+        adx_signal = self._signals.adx
+        fast_ma, slow_ma, rsi, gain, loss, *adx_ = _tick_update(
+            np.asarray(data["high"], dtype=float),
+            np.asarray(data["low"], dtype=float),
+            np.asarray(data["close"], dtype=float),
+            self._signals.fast_ma[-1],
+            self._signals.slow_ma[-1],
+            rsi_signal.gain[-1],
+            rsi_signal.loss[-1],
+            rsi_signal.gain[0],
+            rsi_signal.loss[0],
+            adx_signal.adx[-1],
+            adx_signal.trs[-1],
+            adx_signal.pdms[-1],
+            adx_signal.mdms[-1],
+            *self._tick_constants,
         )
 
         self._signals.fast_ma.append(fast_ma)
         self._signals.slow_ma.append(slow_ma)
-        self._signals.rsi.update(rsi)
-        self._signals.adx.update(adx_)
+        rsi_signal.update((rsi, gain, loss))
+        adx_signal.update(adx_)
 
-        lfast_ma = np.array([self._signals.fast_ma[-2], self._signals.fast_ma[-1]])
-        lslow_ma = np.array([self._signals.slow_ma[-2], self._signals.slow_ma[-1]])
+        # a cross of the last two values, compared as scalars without arrays
+        prev_diff = self._signals.fast_ma[-2] - self._signals.slow_ma[-2]
+        diff = fast_ma - slow_ma
 
         entries = (
-            crossed_above(lfast_ma, lslow_ma)[-1]
-            and rsi.rsi < self._params["rsi_oversold"]
-            and adx_.adx > self._params["adx_strength"]
-        )
-        exits = (
-            crossed_below(lfast_ma, lslow_ma)[-1]
-            and rsi.rsi > self._params["rsi_overbought"]
+            prev_diff < 0
+            and diff >= 0
+            and rsi < self._params["rsi_oversold"]
+            and adx_signal.adx[-1] > self._params["adx_strength"]
         )
+        exits = prev_diff > 0 and diff <= 0 and rsi > self._params["rsi_overbought"]
 
         signal = 0
         if entries:
@@ -227,22 +284,22 @@ class TrendFollowing(BaseStrategy):
         rsi_period: int,
         rsi_overbought: float,
         rsi_oversold: float,
+        adx_out: AdxBatch | None = None,
     ) -> FullSignals:
-        fast_ma = ema_scipy(close, fast_period)
-        slow_ma = ema_scipy(close, slow_period)
+        close = np.asarray(close, dtype=np.float64)
+        fast_ma, slow_ma = ema_numba_dual(close, fast_period, slow_period)
         rsi = rsi_sma_numpy(close, rsi_period)
-        adx_ = adx(high, low, close, adx_period)
+        adx_ = adx(high, low, close, adx_period, out=adx_out)
 
-        entries = (
-            crossed_above(fast_ma, slow_ma)
-            & (rsi.rsi < rsi_oversold)
-            & (adx_.adx > adx_strength)
+        signals = cross_signals(
+            fast_ma,
+            slow_ma,
+            rsi.rsi,
+            adx_.adx,
+            adx_strength,
+            rsi_overbought,
+            rsi_oversold,
         )
-        exits = crossed_below(fast_ma, slow_ma) & (rsi.rsi > rsi_overbought)
-
-        signals = np.zeros_like(close, dtype=np.int8)
-        signals[entries] = 1
-        signals[exits] = -1
 
         return self.FullSignals(
             signals=signals, fast_ma=fast_ma, slow_ma=slow_ma, rsi=rsi, adx=adx_
@@ -278,3 +335,79 @@ class TrendFollowing(BaseStrategy):
         )
 
         return signals.signals
+
+    def generate_signals_grid(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        fast_period,
+        slow_period,
+        adx_period,
+        adx_strength,
+        rsi_period,
+        rsi_overbought,
+        rsi_oversold,
+    ) -> np.ndarray:
+        """
+        `generate_signals` for many parameter combinations at once.
+
+        The parameters are broadcast against each other, every resulting
+        element is one combination (e.g. columns of `itertools.product`).
+        Every indicator is computed once per distinct period and the
+        combinations are evaluated in parallel threads.
+
+        Returns
+        -------
+        np.ndarray
+            2D int8 array, the signals of a combination per row.
+        """
+        high = np.asarray(high, dtype=np.float64).squeeze()
+        low = np.asarray(low, dtype=np.float64).squeeze()
+        close = np.asarray(close, dtype=np.float64).squeeze()
+        (
+            fast_period,
+            slow_period,
+            adx_period,
+            adx_strength,
+            rsi_period,
+            rsi_overbought,
+            rsi_oversold,
+        ) = (
+            np.ravel(p)
+            for p in np.broadcast_arrays(
+                fast_period,
+                slow_period,
+                adx_period,
+                adx_strength,
+                rsi_period,
+                rsi_overbought,
+                rsi_oversold,
+            )
+        )
+
+        ma_periods, ma_idx = np.unique(
+            np.concatenate((fast_period, slow_period)), return_inverse=True
+        )
+        rsi_periods, rsi_idx = np.unique(rsi_period, return_inverse=True)
+        adx_periods, adx_idx = np.unique(adx_period, return_inverse=True)
+
+        ma = np.empty((len(ma_periods), close.shape[0]))
+        for row, period in zip(ma, ma_periods, strict=True):
+            row[:] = ema_numba(close, period)
+        rsi = np.stack([rsi_sma_numpy(close, p).rsi for p in rsi_periods])
+        adx_ = np.stack([adx(high, low, close, p).adx for p in adx_periods])
+
+        k = fast_period.shape[0]
+        return cross_signals_grid(
+            ma,
+            rsi,
+            adx_,
+            ma_idx[:k],
+            ma_idx[k:],
+            rsi_idx,
+            adx_idx,
+            adx_strength.astype(np.float64),
+            rsi_overbought.astype(np.float64),
+            rsi_oversold.astype(np.float64),
+        )
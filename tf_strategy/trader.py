@@ -1,9 +1,11 @@
+import asyncio
 import logging
+from dataclasses import dataclass, field
 from decimal import Decimal, ROUND_DOWN
+from functools import cached_property
 from typing import Any
 
-import pandas as pd
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from tf_strategy.binance.wrapper import BinanceWrapper
 from tf_strategy.common.base import ConnectorBase
@@ -17,9 +19,32 @@ from tf_strategy.common.schemas import (
     Symbol,
 )
 from tf_strategy.strategy.base import BaseStrategy, TradeSignal
+from tf_strategy.strategy.candles import CandleWindow
 
 logger = logging.getLogger(__name__)
 
+# exponent the OCO prices are rounded down to, parsed once
+_PRICE_STEP = Decimal("0.000000")
+# get_last_signal returns enum members, so an identity check is enough
+_OPEN_SIGNAL = TradeSignal.OpenPosition
+
+
+def _init_candles(klines: list[Kline], strategy: BaseStrategy) -> CandleWindow:
+    """Run the strategy over history and return the window for live candles."""
+    if not klines:
+        # no history yet, e.g. a new symbol, there is nothing to run over
+        return CandleWindow(strategy.required_history or 1)
+
+    # every closed candle replaces the oldest one in place
+    candles = CandleWindow.from_klines(klines, size=len(klines))
+    strategy.update_batch(candles)
+
+    # live updates only need the strategy's lookback, not the whole history
+    size = strategy.required_history
+    if size is not None and size < len(candles):
+        candles = CandleWindow.from_klines(klines, size=size)
+    return candles
+
 
 class TradeConfig(BaseModel):
     """Configuration for trading a specific symbol.
@@ -38,10 +63,23 @@ class TradeConfig(BaseModel):
     stop_loss: Decimal
     take_profit: Decimal
 
+    @cached_property
+    def take_profit_multiplier(self) -> Decimal:
+        """Take profit price relative to the entry price, computed once."""
+        return 1 + self.take_profit
+
+    @cached_property
+    def stop_loss_multiplier(self) -> Decimal:
+        """Stop loss price relative to the entry price, computed once."""
+        return 1 - self.stop_loss
 
-class OpenPosition(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class OpenPosition:
     """Represents an open trading position with associated orders.
 
+    Built from already validated order reports, so a plain dataclass.
+
     Attributes:
         open_position: The initial order that opened the position.
         take_profit: The take profit order associated with this position.
@@ -53,22 +91,150 @@ class OpenPosition(BaseModel):
     stop_loss: OrderReport
 
 
-class StrategyWorkerData(BaseModel):
+@dataclass(slots=True)
+class StrategyWorkerData:
     """Container for strategy worker state and configuration.
 
     Attributes:
         strategy: The strategy instance being executed.
         config: Trading configuration for this strategy worker.
         connector: Binance API wrapper for order execution and data fetching.
-        open_positions: List of currently open positions.
+        candles: The latest closed candles the strategy is updated with.
+        open_positions: Currently open positions by the opening order id.
+        positions_by_leg_id: The same positions by their take profit
+            and stop loss order ids, to find the position of a filled leg.
         extra: Dictionary for storing additional worker-specific data (e.g., subscriptions).
     """
 
     strategy: BaseStrategy
     config: TradeConfig
     connector: BinanceWrapper
-    open_positions: list[OpenPosition] = Field(default_factory=list)
-    extra: dict[str, Any] = Field(default_factory=dict)
+    candles: CandleWindow
+    open_positions: dict[str, OpenPosition] = field(default_factory=dict)
+    positions_by_leg_id: dict[str, OpenPosition] = field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
+    _entry_lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, init=False, repr=False
+    )
+
+    async def on_kline(self, kline: Kline, is_closed: bool = False, **_kwargs):
+        """Process incoming candle data and execute trading signals.
+
+        Triggered on each candle matching the configured timeframe and
+        symbol, only closed candles are applied. It:
+        1. Updates the strategy with new candle data
+        2. Generates trading signals
+        3. Executes position opening orders when signals are generated
+
+        The stream also passes `symbol` and `time_interval`, both already
+        fixed by the worker's subscription.
+        """
+        if not is_closed:
+            return
+
+        # a redelivered or out of order candle must not be applied twice
+        if self.candles and kline.close_time <= self.candles.last_close_time:
+            return
+        # add new candle to the window
+        self.candles.append(kline)
+        # update strategy with new candle
+        self.strategy.update_incremental(self.candles)
+
+        # check for trading signal
+        if self.strategy.get_last_signal() is _OPEN_SIGNAL:
+            # the check and the bookkeeping after the orders are one step,
+            # or a candle arriving meanwhile could pass the limit as well
+            async with self._entry_lock:
+                await self._open_position()
+
+    async def _open_position(self):
+        """Open a position with a market order protected by an OCO order."""
+        if len(self.open_positions) >= self.config.max_open_positions:
+            # do nothing if max open positions reached
+            return
+
+        order_report = await self.connector.send_order(
+            Order(
+                symbol=self.config.symbol,
+                type=Type.Market,
+                side="BUY",
+                quantity=self.config.quantity,  # example fixed quantity
+            )
+        )
+
+        if order_report and order_report.status == Status.Filled:
+            oco_report = await self.connector.send_oco_order(
+                OrderOCO(
+                    symbol=self.config.symbol,
+                    side="SELL",
+                    quantity=order_report.executed_qty,
+                    above_type=Type.TakeProfit,
+                    # TODO: need add quantize to connector information about symbol price precision
+                    above_price=(
+                        order_report.price * self.config.take_profit_multiplier
+                    ).quantize(_PRICE_STEP, rounding=ROUND_DOWN),
+                    below_type=Type.StopLoss,
+                    below_price=(
+                        order_report.price * self.config.stop_loss_multiplier
+                    ).quantize(_PRICE_STEP, rounding=ROUND_DOWN),
+                )
+            )
+
+            if oco_report:
+                # save open position with associated orders
+                legs = {leg.type: leg for leg in oco_report}
+                position = OpenPosition(
+                    open_position=order_report,
+                    take_profit=legs[Type.TakeProfit],
+                    stop_loss=legs[Type.StopLoss],
+                )
+                self.open_positions[order_report.order_id] = position
+                for leg in (position.take_profit, position.stop_loss):
+                    self.positions_by_leg_id[leg.order_id] = position
+            else:
+                # immediate close position if oco order failed
+                cancel_report = await self.connector.cancel_order(
+                    CancelOrder(
+                        symbol=self.config.symbol,
+                        order_id=order_report.order_id,
+                    )
+                )
+
+                if cancel_report and cancel_report.status == Status.Canceled:
+                    logger.info(
+                        "Position closed due to OCO order failure",
+                        extra={"connector": "TODO: add `name` for connector"},
+                    )
+                else:
+                    logger.error(
+                        "Failed to close position after OCO order failure",
+                        extra={"connector": "TODO: add `name` for connector"},
+                    )
+        else:
+            # TODO: add `name` for connector
+            logger.error(
+                "Failed to open position: Order not filled",
+                extra={"connector": "TODO: add `name` for connector"},
+            )
+            pass
+
+    async def on_order_report(self, order_report: OrderReport):
+        """Forget a position once its take profit or stop loss is filled."""
+        if (
+            order_report.type in [Type.TakeProfit, Type.StopLoss]
+            and order_report.status == Status.Filled
+        ):
+            position = self.positions_by_leg_id.pop(order_report.order_id, None)
+            # a leg of another worker's position on the shared stream
+            if position is None:
+                return
+            for leg in (position.take_profit, position.stop_loss):
+                self.positions_by_leg_id.pop(leg.order_id, None)
+            del self.open_positions[position.open_position.order_id]
+
+            # if connector is not support oco orders
+            # need close opposite order manually
+            # or emulate oco order in connector         <-- prefer this option
 
 
 class Trader:
@@ -110,161 +276,19 @@ class Trader:
         data = await connector.get_historical_candles(
             symbol=config.symbol, interval=timeframe
         )
-        df = pd.DataFrame(
-            {
-                "open": [i.open_price for i in data],
-                "close": [i.close_price for i in data],
-                "high": [i.high_price for i in data],
-                "low": [i.low_price for i in data],
-                "volume": [i.volume for i in data],
-            },
-            index=[pd.to_datetime(i.close_time, unit='ms') for i in data],
-        )
-
-        # initialize strategy with historical data
-        strategy.update_batch(df)
+        # build the window and initialize strategy with historical data off
+        # the event loop, so workers created together don't run in turn
+        candles = await asyncio.to_thread(_init_candles, data, strategy)
 
         worker_data = StrategyWorkerData(
-            strategy=strategy, config=config, connector=connector
+            strategy=strategy, config=config, connector=connector, candles=candles
         )
 
-        async def process_position(**kwargs):
-            """Process incoming candle data and execute trading signals.
-
-            This callback function is triggered on each closed candle matching
-            the configured timeframe and symbol. It:
-            1. Updates the strategy with new candle data
-            2. Generates trading signals
-            3. Executes position opening orders when signals are generated
-
-            Args:
-                **kwargs: Event data containing 'kline', 'is_closed', 'time_interval', and 'symbol'.
-            """
-
-            if kline := kwargs.get("kline") and kwargs.get("is_closed"):
-                kline: Kline
-                # add new candle to dataframe
-                df.loc[pd.to_datetime(kline.close_time, unit='ms')] = [
-                    kline.open_price,
-                    kline.close_price,
-                    kline.high_price,
-                    kline.low_price,
-                    kline.volume,
-                ]
-                # update strategy with new candle
-                strategy.update_incremental(df)
-
-                # check for trading signal
-                if strategy.get_last_signal() == TradeSignal.OpenPosition:
-                    if (
-                        len(worker_data.open_positions)
-                        >= worker_data.config.max_open_positions
-                    ):
-                        # do nothing if max open positions reached
-                        return
-
-                    order_report = await worker_data.connector.send_order(
-                        Order(
-                            symbol=worker_data.config.symbol,
-                            type=Type.Market,
-                            side="BUY",
-                            quantity=worker_data.config.quantity,  # example fixed quantity
-                        )
-                    )
-
-                    if order_report and order_report.status == Status.Filled:
-                        oco_report = await worker_data.connector.send_oco_order(
-                            OrderOCO(
-                                symbol=worker_data.config.symbol,
-                                side="SELL",
-                                quantity=order_report.executed_qty,
-                                above_type=Type.TakeProfit,
-                                # TODO: need add quantize to connector information about symbol price precision
-                                above_price=(
-                                    order_report.price
-                                    * (1 + worker_data.config.take_profit)
-                                ).quantize(Decimal("0.000000"), rounding=ROUND_DOWN),
-                                below_type=Type.StopLoss,
-                                below_price=(
-                                    order_report.price
-                                    * (1 - worker_data.config.stop_loss)
-                                ).quantize(Decimal("0.000000"), rounding=ROUND_DOWN),
-                            )
-                        )
-
-                        if oco_report:
-                            # save open position with associated orders
-                            worker_data.open_positions.append(
-                                OpenPosition(
-                                    open_position=order_report,
-                                    take_profit=(
-                                        oco_report[0]
-                                        if oco_report[0].type == Type.TakeProfit
-                                        else oco_report[1]
-                                    ),
-                                    stop_loss=(
-                                        oco_report[0]
-                                        if oco_report[0].type == Type.StopLoss
-                                        else oco_report[1]
-                                    ),
-                                )
-                            )
-                        else:
-                            # immediate close position if oco order failed
-                            cancel_report = await worker_data.connector.cancel_order(
-                                CancelOrder(
-                                    symbol=worker_data.config.symbol,
-                                    order_id=order_report.order_id,
-                                )
-                            )
-
-                            if (
-                                cancel_report
-                                and cancel_report.status == Status.Canceled
-                            ):
-                                logger.info(
-                                    "Position closed due to OCO order failure",
-                                    extra={
-                                        "connector": "TODO: add `name` for connector"
-                                    },
-                                )
-                            else:
-                                logger.error(
-                                    "Failed to close position after OCO order failure",
-                                    extra={
-                                        "connector": "TODO: add `name` for connector"
-                                    },
-                                )
-                    else:
-                        # TODO: add `name` for connector
-                        logger.error(
-                            "Failed to open position: Order not filled",
-                            extra={"connector": "TODO: add `name` for connector"},
-                        )
-                        pass
-
-            elif order_report := kwargs.get("order_report"):
-                order_report: OrderReport
-
-                if (
-                    order_report.type in [Type.TakeProfit, Type.StopLoss]
-                    and order_report.status == Status.Filled
-                ):
-                    cl = [
-                        i
-                        for i in worker_data.open_positions
-                        if i.take_profit.order_id == order_report.order_id
-                        or i.stop_loss.order_id == order_report.order_id
-                    ]
-                    worker_data.open_positions.remove(cl[0])
-
-                    # if connector is not support oco orders
-                    # need close opposite order manually
-                    # or emulate oco order in connector         <-- prefer this option
-
         # make subscription on kline updates
         candle_subscribe = await worker_data.connector.kline_subscribe(
-            symbol=config.symbol, time_interval=timeframe, callback=process_position
+            symbol=config.symbol,
+            time_interval=timeframe,
+            handler=worker_data.on_kline,
         )
         worker_data.extra["kline_subscribe"] = candle_subscribe
 
@@ -273,7 +297,7 @@ class Trader:
 
         # make other subscriptions if needed
         order_update = await worker_data.connector.orders_subscribe(
-            handler=process_position
+            handler=worker_data.on_order_report
         )
         worker_data.extra["open_orders"] = order_update
 